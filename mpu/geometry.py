@@ -10,8 +10,11 @@ For more advanced use cases, see:
 from __future__ import annotations
 
 # Core Library
+import heapq
 import math
-from typing import Any, cast
+import numbers
+from fractions import Fraction
+from typing import Any, Iterable, Iterator, cast
 
 # First party
 from mpu.datastructures import Interval
@@ -30,6 +33,8 @@ class Point:
     y : float
     """
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -55,16 +60,49 @@ class LineSegment:
     """
     A line segment a a 2-dimensional Euclidean space.
 
+    The angle, the bounding box and the equation parameters are computed
+    once and cached. Assigning p1 or p2 clears the cache. Modifying a point
+    in place does not, so the cached values are stale until the point is
+    assigned again, e.g. ``segment.p1 = segment.p1``.
+
     Parameters
     ----------
     p1 : Point
     p2 : Point
     """
 
+    __slots__ = ("_p1", "_p2", "name", "_angle", "_bounding_box", "_equation")
+
     def __init__(self, p1: Point, p2: Point, name: str = "LineSegment"):
-        self.p1 = p1
-        self.p2 = p2
+        self._p1 = p1
+        self._p2 = p2
         self.name = name
+        self._clear_cache()
+
+    @property
+    def p1(self) -> Point:
+        """Get the first end point."""
+        return self._p1
+
+    @p1.setter
+    def p1(self, value: Point) -> None:
+        self._p1 = value
+        self._clear_cache()
+
+    @property
+    def p2(self) -> Point:
+        """Get the second end point."""
+        return self._p2
+
+    @p2.setter
+    def p2(self, value: Point) -> None:
+        self._p2 = value
+        self._clear_cache()
+
+    def _clear_cache(self) -> None:
+        self._angle: float | None = None
+        self._bounding_box: tuple[Point, Point] | None = None
+        self._equation: tuple[float, float] | None = None
 
     def length(self) -> float:
         """Get the length of this line segment."""
@@ -76,13 +114,15 @@ class LineSegment:
 
     def angle(self) -> float:
         """Get the angle of this line."""
-        dx = self.p2.x - self.p1.x
-        dy = self.p2.y - self.p1.y
-        theta = math.atan2(dy, dx)
-        angle = math.degrees(theta)  # angle is in (-180, 180]
-        if angle < 0:
-            angle = FULL_ROTATION + angle
-        return angle
+        if self._angle is None:
+            dx = self._p2.x - self._p1.x
+            dy = self._p2.y - self._p1.y
+            theta = math.atan2(dy, dx)
+            angle = math.degrees(theta)  # angle is in (-180, 180]
+            if angle < 0:
+                angle = FULL_ROTATION + angle
+            self._angle = angle
+        return self._angle
 
     def _get_equation_parameters(self) -> tuple[float, float]:
         """
@@ -94,16 +134,15 @@ class LineSegment:
         <=> m = (y1 - y2) /(x1-x2)
            t = y1 - m*x1
         """
-        if self.p1.x == self.p2.x:
-            raise ValueError("The given points have the same x-coordinate")
-
-        y1 = self.p1.y
-        y2 = self.p2.y
-        x1 = self.p1.x
-        x2 = self.p2.x
-        m = (y1 - y2) / (x1 - x2)
-        t = y1 - m * x1
-        return m, t
+        if self._equation is None:
+            x1, y1 = self._p1.x, self._p1.y
+            x2, y2 = self._p2.x, self._p2.y
+            if x1 == x2:
+                raise ValueError("The given points have the same x-coordinate")
+            m = (y1 - y2) / (x1 - x2)
+            t = y1 - m * x1
+            self._equation = (m, t)
+        return self._equation
 
     def simplify(self) -> Point | LineSegment:
         """Simplify this line segment to a point, if possible."""
@@ -133,9 +172,10 @@ class LineSegment:
             return p1  # we know they intersect
         elif other.is_point():
             return other.intersect(self)
-        elif self.angle() == other.angle():
+        is_self_vertical = self.angle() in (90, 270)
+        if self.angle() == other.angle():
             # The overlap is a line segment or a point!
-            if self.angle() in [90, 270]:
+            if is_self_vertical:
                 # The line segment is not a function
                 x = self.p1.x
                 return _get_straight_line_intersection(
@@ -149,36 +189,31 @@ class LineSegment:
                 p1 = Point(x_start, m * x_start + t)
                 p2 = Point(x_end, m * x_end + t)
                 return LineSegment(p1, p2)
-        else:
-            # We know that we have to real line segments, that those intersect
-            # and that their angle is different. Hence the return value
-            # must be a point
-            if self.angle() in [90, 270]:
-                x = self.p1.x
-
-                if other.angle() in [90, 270]:
-                    return _get_straight_line_intersection(
-                        x, other.p1.y, other.p2.y, self.p1.y, self.p2.y
-                    )
-                else:
-                    m, t = other._get_equation_parameters()
-                    y = m * x + t
-                    return Point(x, y)
-            elif other.angle() in [90, 270]:
-                x = other.p1.x
-                m, t = self._get_equation_parameters()
-                y = m * x + t
-                return Point(x, y)
-            else:
-                # The overlap is a point
-                m1, t1 = self._get_equation_parameters()
-                m2, t2 = other._get_equation_parameters()
-                # m1 * x + t1 = m2 * x + t2
-                # <=> (m1 - m2) * x = t2 - t1
-                # <=> x = (t2 - t1) / (m1 - m2)
-                x = (t2 - t1) / (m1 - m2)
-                y = m1 * x + t1
-                return Point(x, y)
+        # We know that we have to real line segments, that those intersect
+        # and that their angle is different. Hence the return value
+        # must be a point
+        is_other_vertical = other.angle() in (90, 270)
+        if is_self_vertical:
+            x = self.p1.x
+            if is_other_vertical:
+                return _get_straight_line_intersection(
+                    x, other.p1.y, other.p2.y, self.p1.y, self.p2.y
+                )
+            m, t = other._get_equation_parameters()
+            return Point(x, m * x + t)
+        elif is_other_vertical:
+            x = other.p1.x
+            m, t = self._get_equation_parameters()
+            return Point(x, m * x + t)
+        # The overlap is a point
+        m1, t1 = self._get_equation_parameters()
+        m2, t2 = other._get_equation_parameters()
+        # m1 * x + t1 = m2 * x + t2
+        # <=> (m1 - m2) * x = t2 - t1
+        # <=> x = (t2 - t1) / (m1 - m2)
+        x = (t2 - t1) / (m1 - m2)
+        y = m1 * x + t1
+        return Point(x, y)
 
     def bounding_box(self) -> tuple[Point, Point]:
         """
@@ -187,11 +222,13 @@ class LineSegment:
         The p1 point is in the lower left corner, the p2 one at the
         upper right corner.
         """
-        result = (
-            Point(min(self.p1.x, self.p2.x), min(self.p1.y, self.p2.y)),
-            Point(max(self.p1.x, self.p2.x), max(self.p1.y, self.p2.y)),
-        )
-        return result
+        if self._bounding_box is None:
+            p1, p2 = self._p1, self._p2
+            self._bounding_box = (
+                Point(min(p1.x, p2.x), min(p1.y, p2.y)),
+                Point(max(p1.x, p2.x), max(p1.y, p2.y)),
+            )
+        return self._bounding_box
 
     def __str__(self) -> str:
         if self.name == "LineSegment":
@@ -246,30 +283,35 @@ def crossproduct(a: Point, b: Point) -> float:
     return a.x * b.y - b.x * a.y
 
 
+def _cross(ax1: Any, ay1: Any, ax2: Any, ay2: Any, px: Any, py: Any) -> Any:
+    """
+    Get the cross product of (a2 - a1) and (p - a1).
+
+    This works on floats as well as on NumPy arrays. It is positive if p is
+    left of the line from a1 to a2.
+    """
+    return (ax2 - ax1) * (py - ay1) - (px - ax1) * (ay2 - ay1)
+
+
 def is_point_on_line(a: LineSegment, b: Point) -> bool:
     """Check if point b is on LineSegment a."""
-    # Move the image, so that a.p1 is on (0|0)
-    p2 = Point(a.p2.x - a.p1.x, a.p2.y - a.p1.y)
-    a_tmp = LineSegment(Point(0, 0), p2)
-    b_tmp = Point(b.x - a.p1.x, b.y - a.p1.y)
-    r = crossproduct(a_tmp.p2, b_tmp)
-    return abs(r) < EPSILON
+    p1, p2 = a.p1, a.p2
+    return abs(_cross(p1.x, p1.y, p2.x, p2.y, b.x, b.y)) < EPSILON
 
 
 def is_point_right_of_line(a: LineSegment, b: Point) -> bool:
     """Check if point b is right of line a."""
-    # Move the image, so that a.p1 is on (0|0)
-    a_tmp = LineSegment(Point(0, 0), Point(a.p2.x - a.p1.x, a.p2.y - a.p1.y))
-    b_tmp = Point(b.x - a.p1.x, b.y - a.p1.y)
-    return crossproduct(a_tmp.p2, b_tmp) < 0
+    p1, p2 = a.p1, a.p2
+    return _cross(p1.x, p1.y, p2.x, p2.y, b.x, b.y) < 0
 
 
 def line_segment_touches_or_crosses_line(a: LineSegment, b: LineSegment) -> bool:
     """Check if line segment a touches or crosses line segment b."""
+    p1, p2 = a.p1, a.p2
+    cross1 = _cross(p1.x, p1.y, p2.x, p2.y, b.p1.x, b.p1.y)
+    cross2 = _cross(p1.x, p1.y, p2.x, p2.y, b.p2.x, b.p2.y)
     return (
-        is_point_on_line(a, b.p1)
-        or is_point_on_line(a, b.p2)
-        or (is_point_right_of_line(a, b.p1) ^ is_point_right_of_line(a, b.p2))
+        abs(cross1) < EPSILON or abs(cross2) < EPSILON or ((cross1 < 0) ^ (cross2 < 0))
     )
 
 
@@ -306,3 +348,703 @@ def get_all_intersecting_lines_by_brute_force(
                 tmp = frozenset({lines[i], lines[j]})
                 intersections.add(tmp)
     return intersections
+
+
+def get_all_intersecting_lines(
+    lines: list[LineSegment],
+) -> set[frozenset[LineSegment]]:
+    """
+    Get all intersecting lines with a sweep line algorithm.
+
+    This is the Bentley-Ottmann algorithm in the formulation of de Berg et al.
+    It runs in O((n + k) log n) for n lines and k intersections, as long as
+    the lines which cross the sweep line at the same time are few. The
+    coordinates are converted to fractions, so touching, collinear, vertical
+    and horizontal lines are handled exactly.
+
+    The result is not always the same as the one of
+    :func:`get_all_intersecting_lines_by_brute_force`, so it is no drop-in
+    replacement. Candidate pairs are lines which intersect exactly, and they
+    are reported if :func:`do_lines_intersect` accepts them. The brute force
+    version additionally reports lines which do not intersect, but which
+    :func:`do_lines_intersect` accepts: It compares cross products with
+    EPSILON, so it accepts an end point which is up to EPSILON / length away
+    from the infinite extension of the other line. For lines of length 1
+    this is 1e-6, but for lines of length 1e-3, e.g. in degrees of latitude
+    and longitude, it is 1e-3. Such near misses are rare if the coordinates
+    are scaled up.
+
+    Parameters
+    ----------
+    lines : all lines you want to check, in no order
+
+    Returns
+    -------
+    intersections : a set that contains all pairs of intersecting lines
+
+    Examples
+    --------
+    >>> a = LineSegment(Point(0, 0), Point(2, 2), "a")
+    >>> b = LineSegment(Point(0, 2), Point(2, 0), "b")
+    >>> c = LineSegment(Point(3, 0), Point(3, 2), "c")
+    >>> get_all_intersecting_lines([a, b, c]) == {frozenset({a, b})}
+    True
+    """
+    candidates = _SweepLine(lines).run()
+    return {pair for pair in candidates if do_lines_intersect(*_as_pair(pair))}
+
+
+def _as_pair(pair: frozenset[LineSegment]) -> tuple[LineSegment, LineSegment]:
+    """Get both lines of a pair, which is a single line if both are equal."""
+    if len(pair) == 1:
+        (line,) = pair
+        return line, line
+    first, second = pair
+    return first, second
+
+
+class _SweepSegment:
+    """
+    A LineSegment with exact coordinates, oriented in sweep order.
+
+    Float copies of the values allow to skip most exact computations.
+    """
+
+    __slots__ = (
+        "line",
+        "index",
+        "upper",
+        "lower",
+        "inverse_slope",
+        "float_upper",
+        "float_inverse_slope",
+        "box",
+    )
+
+    def __init__(self, line: LineSegment, index: int):
+        self.line = line
+        self.index = index
+        p1 = (Fraction(line.p1.x), Fraction(line.p1.y))
+        p2 = (Fraction(line.p2.x), Fraction(line.p2.y))
+        # The upper endpoint is the one which the sweep line reaches first
+        self.upper, self.lower = sorted([p1, p2], key=_event_key)
+        dy = self.upper[1] - self.lower[1]
+        self.inverse_slope = (self.lower[0] - self.upper[0]) / dy if dy else None
+        self.float_upper = (float(self.upper[0]), float(self.upper[1]))
+        self.float_inverse_slope = (
+            None if self.inverse_slope is None else float(self.inverse_slope)
+        )
+        lower_left, upper_right = line.bounding_box()
+        self.box = (lower_left.x, lower_left.y, upper_right.x, upper_right.y)
+
+    def x_at(self, point: tuple[Fraction, Fraction]) -> Fraction:
+        """Get the x-coordinate where the sweep line at point crosses it."""
+        if self.inverse_slope is None:
+            # A horizontal segment contains all event points on it
+            return point[0]
+        return self.upper[0] + (self.upper[1] - point[1]) * self.inverse_slope
+
+    def compare_x(
+        self, point: tuple[Fraction, Fraction], float_point: tuple[float, float]
+    ) -> int:
+        """Get the sign of x_at(point) - point.x."""
+        if self.float_inverse_slope is None:
+            return 0
+        ux, uy = self.float_upper
+        x, y = float_point
+        difference = ux + (uy - y) * self.float_inverse_slope - x
+        # A generous bound of the rounding errors of the float computation
+        error = 1e-12 * (
+            abs(ux) + abs(x) + (abs(uy) + abs(y)) * abs(self.float_inverse_slope)
+        )
+        if difference > error:
+            return 1
+        if difference < -error:
+            return -1
+        exact_difference = self.x_at(point) - point[0]
+        return (exact_difference > 0) - (exact_difference < 0)
+
+    def order_below(self) -> tuple[int, Fraction, int]:
+        """Sort key for segments through a point, just below the sweep line."""
+        if self.inverse_slope is None:
+            return (1, Fraction(0), self.index)
+        return (0, self.inverse_slope, self.index)
+
+
+def _event_key(
+    point: tuple[Fraction, Fraction],
+) -> tuple[float, float, Fraction, Fraction]:
+    """
+    Get the sort key of an event point in sweep order.
+
+    The sweep line moves down, and from left to right on each height.
+    Rounding to floats preserves the order, so the exact coordinates are
+    only compared if the floats are equal.
+    """
+    x, y = point
+    return (-float(y), float(x), -y, x)
+
+
+class _SweepLine:
+    """
+    The state of the Bentley-Ottmann algorithm.
+
+    The status is a list of the segments which cross the sweep line, ordered
+    from left to right. It is searched with bisection, as only few segments
+    cross the sweep line at the same time in typical inputs.
+    """
+
+    def __init__(self, lines: list[LineSegment]):
+        self.events: list[tuple[float, float, Fraction, Fraction]] = []
+        self.starting: dict[tuple[Fraction, Fraction], list[_SweepSegment]] = {}
+        self.status: list[_SweepSegment] = []
+        self.intersections: set[frozenset[LineSegment]] = set()
+        for index, line in enumerate(lines):
+            segment = _SweepSegment(line, index)
+            self._add_event(segment.upper)
+            self.starting[segment.upper].append(segment)
+            self._add_event(segment.lower)
+
+    def _add_event(self, point: tuple[Fraction, Fraction]) -> None:
+        if point not in self.starting:
+            self.starting[point] = []
+            heapq.heappush(self.events, _event_key(point))
+
+    def run(self) -> set[frozenset[LineSegment]]:
+        while self.events:
+            _, _, y, x = heapq.heappop(self.events)
+            self._handle_event((x, -y))
+        return self.intersections
+
+    def _handle_event(self, point: tuple[Fraction, Fraction]) -> None:
+        starting = self.starting.pop(point)
+        start, end = self._locate(point)
+        containing = self.status[start:end]
+        involved = starting + containing
+        for i, segment in enumerate(involved):
+            for other in involved[i + 1 :]:
+                self.intersections.add(frozenset({segment.line, other.line}))
+
+        # Reorder the segments through point to their order below it
+        continuing = [
+            segment
+            for segment in starting + containing
+            if segment.lower != point and segment.upper != segment.lower
+        ]
+        continuing.sort(key=_SweepSegment.order_below)
+        self.status[start:end] = continuing
+
+        if continuing:
+            self._find_new_event(start - 1, start, point)
+            end = start + len(continuing)
+            self._find_new_event(end - 1, end, point)
+        else:
+            self._find_new_event(start - 1, start, point)
+
+    def _locate(self, point: tuple[Fraction, Fraction]) -> tuple[int, int]:
+        """Get the slice of the status with the segments through point."""
+        float_point = (float(point[0]), float(point[1]))
+        low, high = 0, len(self.status)
+        while low < high:
+            middle = (low + high) // 2
+            if self.status[middle].compare_x(point, float_point) < 0:
+                low = middle + 1
+            else:
+                high = middle
+        end = low
+        while (
+            end < len(self.status)
+            and self.status[end].compare_x(point, float_point) == 0
+        ):
+            end += 1
+        return low, end
+
+    def _find_new_event(
+        self, left: int, right: int, point: tuple[Fraction, Fraction]
+    ) -> None:
+        """Add the crossing of two neighbors as event, if it comes later."""
+        if left < 0 or right >= len(self.status):
+            return
+        crossing = _get_crossing(self.status[left], self.status[right])
+        if crossing is not None and _event_key(crossing) > _event_key(point):
+            self._add_event(crossing)
+
+
+def _get_crossing(
+    a: _SweepSegment, b: _SweepSegment
+) -> tuple[Fraction, Fraction] | None:
+    """Get the single intersection point of two segments, if there is one."""
+    a_box, b_box = a.box, b.box
+    if (
+        a_box[2] < b_box[0]
+        or b_box[2] < a_box[0]
+        or a_box[3] < b_box[1]
+        or b_box[3] < a_box[1]
+    ):
+        return None
+    ax, ay = a.upper
+    bx, by = b.upper
+    adx, ady = a.lower[0] - ax, a.lower[1] - ay
+    bdx, bdy = b.lower[0] - bx, b.lower[1] - by
+    denominator = adx * bdy - ady * bdx
+    if denominator == 0:
+        # Parallel segments meet at endpoints, which are events anyway
+        return None
+    t = ((bx - ax) * bdy - (by - ay) * bdx) / denominator
+    u = ((bx - ax) * ady - (by - ay) * adx) / denominator
+    if 0 <= t <= 1 and 0 <= u <= 1:
+        return (ax + t * adx, ay + t * ady)
+    return None
+
+
+class SegmentIndex:
+    """
+    A spatial index of line segments for box and intersection queries.
+
+    The plane is divided into a sparse uniform grid of square cells. Each
+    segment is stored in all cells which its bounding box overlaps. Segments
+    which would cover too many cells are kept in a separate list, which is
+    checked by every query. The index behaves like a set: Equal segments are
+    stored once.
+
+    Parameters
+    ----------
+    lines : Iterable[LineSegment], optional
+        Segments which are bulk loaded
+    cell_size : float | None, optional
+        The side length of the cells. By default, it is twice the average
+        side length of the bounding boxes of the segments. Then the cell
+        size adapts to inserted segments: Whenever the index has grown to
+        more than twice its size at the last adaption, the cell size is
+        computed again and the grid is rebuilt if it changed by more than a
+        factor of two. Hence an index which starts empty works as well as a
+        bulk loaded one. A given cell_size is kept.
+
+    Examples
+    --------
+    >>> a = LineSegment(Point(0, 0), Point(2, 2), "a")
+    >>> b = LineSegment(Point(5, 5), Point(6, 5), "b")
+    >>> index = SegmentIndex([a, b])
+    >>> index.query_box((Point(1, 1), Point(3, 3)))
+    {a}
+    >>> index.query_intersecting(LineSegment(Point(0, 2), Point(2, 0)))
+    {a}
+    >>> index.delete(a)
+    >>> len(index)
+    1
+    """
+
+    max_cells_per_segment = 64
+
+    def __init__(
+        self, lines: Iterable[LineSegment] = (), cell_size: float | None = None
+    ):
+        lines = list(lines)
+        self._is_adaptive = cell_size is None
+        if cell_size is None:
+            cell_size = _get_default_cell_size(lines)
+        if not cell_size > 0:
+            raise ValueError(f"cell_size={cell_size} must be positive")
+        self.cell_size = cell_size
+        self._boxes: dict[LineSegment, tuple[float, float, float, float]] = {}
+        self._cells: dict[tuple[int, int], set[LineSegment]] = {}
+        self._large: set[LineSegment] = set()
+        self._side_sum = 0.0
+        self._adapted_size = len(lines)
+        for line in lines:
+            self.insert(line)
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, line: Any) -> bool:
+        return line in self._boxes
+
+    def __iter__(self) -> Iterator[LineSegment]:
+        return iter(self._boxes)
+
+    def insert(self, line: LineSegment) -> None:
+        """Add a line segment to the index."""
+        if line in self._boxes:
+            return
+        lower_left, upper_right = line.bounding_box()
+        box = (lower_left.x, lower_left.y, upper_right.x, upper_right.y)
+        self._boxes[line] = box
+        self._side_sum += _get_box_side(box)
+        self._add_to_cells(line, box)
+        if self._is_adaptive and len(self._boxes) > 2 * self._adapted_size:
+            self._adapt_cell_size()
+
+    def _add_to_cells(
+        self, line: LineSegment, box: tuple[float, float, float, float]
+    ) -> None:
+        cells = self._get_cell_range(box)
+        if _count_cells(cells) > self.max_cells_per_segment:
+            self._large.add(line)
+            return
+        for cell in _iter_cells(cells):
+            self._cells.setdefault(cell, set()).add(line)
+
+    def _adapt_cell_size(self) -> None:
+        """Rebuild the grid if the cell size does not fit the segments."""
+        self._adapted_size = len(self._boxes)
+        cell_size = 2 * self._side_sum / len(self._boxes)
+        if cell_size <= 0 or 0.5 * self.cell_size <= cell_size <= 2 * self.cell_size:
+            return
+        self.cell_size = cell_size
+        self._cells = {}
+        self._large = set()
+        for line, box in self._boxes.items():
+            self._add_to_cells(line, box)
+
+    def delete(self, line: LineSegment) -> None:
+        """Remove a line segment from the index. Raise KeyError if absent."""
+        box = self._boxes.pop(line)
+        self._side_sum -= _get_box_side(box)
+        if line in self._large:
+            self._large.remove(line)
+            return
+        for cell in _iter_cells(self._get_cell_range(box)):
+            lines = self._cells[cell]
+            lines.remove(line)
+            if not lines:
+                del self._cells[cell]
+
+    def query_box(self, box: tuple[Point, Point]) -> set[LineSegment]:
+        """
+        Get all line segments whose bounding box intersects box.
+
+        Parameters
+        ----------
+        box : tuple[Point, Point]
+            The lower left and the upper right corner, as returned by
+            LineSegment.bounding_box
+
+        Returns
+        -------
+        lines : set[LineSegment]
+        """
+        lower_left, upper_right = box
+        query = (lower_left.x, lower_left.y, upper_right.x, upper_right.y)
+        candidates = set(self._large)
+        cells = self._get_cell_range(query)
+        if _count_cells(cells) <= len(self._cells):
+            for cell in _iter_cells(cells):
+                candidates.update(self._cells.get(cell, ()))
+        else:
+            # The box is big, so it is cheaper to go through the used cells
+            x_min, y_min, x_max, y_max = cells
+            for (x, y), lines in self._cells.items():
+                if x_min <= x <= x_max and y_min <= y <= y_max:
+                    candidates.update(lines)
+        return {
+            line for line in candidates if _do_boxes_overlap(self._boxes[line], query)
+        }
+
+    def query_intersecting(self, line: LineSegment) -> set[LineSegment]:
+        """
+        Get all line segments of the index which intersect line.
+
+        Parameters
+        ----------
+        line : LineSegment
+
+        Returns
+        -------
+        lines : set[LineSegment]
+        """
+        return {
+            other
+            for other in self.query_box(line.bounding_box())
+            if do_lines_intersect(line, other)
+        }
+
+    def _get_cell_range(
+        self, box: tuple[float, float, float, float]
+    ) -> tuple[int, int, int, int]:
+        """Get the first and the last cell in x and y direction of box."""
+        x_min, y_min, x_max, y_max = box
+        size = self.cell_size
+        return (
+            math.floor(x_min / size),
+            math.floor(y_min / size),
+            math.floor(x_max / size),
+            math.floor(y_max / size),
+        )
+
+
+def _get_default_cell_size(lines: list[LineSegment]) -> float:
+    sides = [
+        max(abs(line.p1.x - line.p2.x), abs(line.p1.y - line.p2.y)) for line in lines
+    ]
+    average_side = sum(sides) / len(sides) if sides else 0
+    return 2 * average_side if average_side > 0 else 1.0
+
+
+def _get_box_side(box: tuple[float, float, float, float]) -> float:
+    return max(box[2] - box[0], box[3] - box[1])
+
+
+def _count_cells(cells: tuple[int, int, int, int]) -> int:
+    x_min, y_min, x_max, y_max = cells
+    return (x_max - x_min + 1) * (y_max - y_min + 1)
+
+
+def _iter_cells(cells: tuple[int, int, int, int]) -> Iterator[tuple[int, int]]:
+    x_min, y_min, x_max, y_max = cells
+    for x in range(x_min, x_max + 1):
+        for y in range(y_min, y_max + 1):
+            yield (x, y)
+
+
+def _do_boxes_overlap(
+    a: tuple[float, float, float, float], b: tuple[float, float, float, float]
+) -> bool:
+    """Check if boxes (x_min, y_min, x_max, y_max) intersect or touch."""
+    return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+
+class SegmentArray:
+    """
+    Line segments stored column-wise in NumPy arrays.
+
+    The predicates compute the same floating point operations as
+    :func:`do_lines_intersect`, but for many segments at once and without
+    creating Point and LineSegment objects. This requires NumPy.
+
+    Parameters
+    ----------
+    x1, y1, x2, y2 : array_like
+        The coordinates of the first and the second point of each segment
+
+    Examples
+    --------
+    >>> segments = SegmentArray([0, 3], [0, 0], [2, 3], [2, 2])
+    >>> segments.intersects(LineSegment(Point(0, 2), Point(2, 0)))
+    array([ True, False])
+    >>> segments.intersection_points(LineSegment(Point(0, 2), Point(2, 0)))
+    (array([ 1., nan]), array([ 1., nan]))
+    """
+
+    def __init__(self, x1: Any, y1: Any, x2: Any, y2: Any):
+        # Third party
+        import numpy as np
+
+        columns = [np.asarray(column, dtype=np.float64) for column in (x1, y1, x2, y2)]
+        if (
+            any(column.ndim != 1 for column in columns)
+            or len({len(column) for column in columns}) != 1
+        ):
+            raise ValueError("x1, y1, x2, y2 must be 1-dimensional of equal length")
+        self.x1, self.y1, self.x2, self.y2 = columns
+
+    @classmethod
+    def from_line_segments(cls, lines: Iterable[LineSegment]) -> SegmentArray:
+        """Create a SegmentArray from LineSegment objects."""
+        # Third party
+        import numpy as np
+
+        coordinates = np.array(
+            [[line.p1.x, line.p1.y, line.p2.x, line.p2.y] for line in lines],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        return cls(*coordinates.T)
+
+    def __len__(self) -> int:
+        return len(self.x1)
+
+    def __getitem__(self, key: Any) -> LineSegment | SegmentArray:
+        """Get a LineSegment for an integer, otherwise a SegmentArray."""
+        if isinstance(key, numbers.Integral):
+            return LineSegment(
+                Point(float(self.x1[key]), float(self.y1[key])),
+                Point(float(self.x2[key]), float(self.y2[key])),
+            )
+        return SegmentArray(self.x1[key], self.y1[key], self.x2[key], self.y2[key])
+
+    def bounding_boxes(self) -> tuple[Any, Any, Any, Any]:
+        """Get the arrays x_min, y_min, x_max, y_max of the bounding boxes."""
+        # Third party
+        import numpy as np
+
+        return (
+            np.minimum(self.x1, self.x2),
+            np.minimum(self.y1, self.y2),
+            np.maximum(self.x1, self.x2),
+            np.maximum(self.y1, self.y2),
+        )
+
+    def filter_box(self, box: tuple[Point, Point]) -> Any:
+        """
+        Get a mask of the segments whose bounding box intersects box.
+
+        Parameters
+        ----------
+        box : tuple[Point, Point]
+            The lower left and the upper right corner, as returned by
+            LineSegment.bounding_box
+        """
+        x_min, y_min, x_max, y_max = self.bounding_boxes()
+        lower_left, upper_right = box
+        return (
+            (x_min <= upper_right.x)
+            & (x_max >= lower_left.x)
+            & (y_min <= upper_right.y)
+            & (y_max >= lower_left.y)
+        )
+
+    def orientation(self, point: Point) -> Any:
+        """
+        Get the side of each segment on which point lies.
+
+        Returns
+        -------
+        orientation : numpy.ndarray
+            -1 if the point is right of the line through the segment (see
+            :func:`is_point_right_of_line`), 0 if it is on the line (see
+            :func:`is_point_on_line`) and 1 if it is left of it.
+        """
+        # Third party
+        import numpy as np
+
+        cross = _cross(self.x1, self.y1, self.x2, self.y2, point.x, point.y)
+        return np.where(np.abs(cross) < EPSILON, 0, np.sign(cross)).astype(np.int8)
+
+    def intersects(self, line: LineSegment) -> Any:
+        """Get a mask of the segments which intersect line."""
+        return _intersects(
+            self._columns(), (line.p1.x, line.p1.y, line.p2.x, line.p2.y)
+        )
+
+    def intersection_points(self, line: LineSegment) -> tuple[Any, Any]:
+        """
+        Get the points where the segments intersect line.
+
+        Returns
+        -------
+        x, y : tuple[numpy.ndarray, numpy.ndarray]
+            NaN for segments which do not intersect line or which are
+            parallel to it
+        """
+        b = (line.p1.x, line.p1.y, line.p2.x, line.p2.y)
+        return _intersection_points(self._columns(), b, _intersects(self._columns(), b))
+
+    def intersecting_pairs(
+        self,
+        other: SegmentArray | None = None,
+        max_chunk_size: int = 2**22,
+        return_points: bool = False,
+    ) -> tuple[Any, ...]:
+        """
+        Find all pairs of intersecting segments of self and other.
+
+        The pairs are checked in chunks of at most max_chunk_size pairs.
+        Within a chunk, only pairs with intersecting bounding boxes are
+        checked further.
+
+        Parameters
+        ----------
+        other : SegmentArray | None, optional
+            If None, the pairs i < j of self are checked
+        max_chunk_size : int, optional (default: 4 194 304)
+        return_points : bool, optional (default: False)
+            Also return the intersection points, see intersection_points
+
+        Returns
+        -------
+        pairs : tuple[numpy.ndarray, ...]
+            The indices i into self and j into other of each intersecting
+            pair, and the coordinates x and y if return_points is True
+        """
+        # Third party
+        import numpy as np
+
+        b = self if other is None else other
+        rows_per_chunk = max(1, max_chunk_size // max(len(b), 1))
+        a_boxes, b_boxes = self.bounding_boxes(), b.bounding_boxes()
+        results = []
+        for start in range(0, len(self), rows_per_chunk):
+            rows = slice(start, start + rows_per_chunk)
+            overlap = (
+                (a_boxes[0][rows, None] <= b_boxes[2])
+                & (a_boxes[2][rows, None] >= b_boxes[0])
+                & (a_boxes[1][rows, None] <= b_boxes[3])
+                & (a_boxes[3][rows, None] >= b_boxes[1])
+            )
+            if other is None:
+                overlap &= np.arange(start, start + len(overlap))[:, None] < np.arange(
+                    len(b)
+                )
+            i, j = np.nonzero(overlap)
+            i += start
+            a_columns = tuple(column[i] for column in self._columns())
+            b_columns = tuple(column[j] for column in b._columns())
+            mask = _intersects(a_columns, b_columns)
+            result: tuple[Any, ...] = (i[mask], j[mask])
+            if return_points:
+                a_columns = tuple(column[mask] for column in a_columns)
+                b_columns = tuple(column[mask] for column in b_columns)
+                result += _intersection_points(a_columns, b_columns, True)
+            results.append(result)
+        if not results:
+            empty = np.zeros(0, dtype=np.intp)
+            return (empty, empty, np.zeros(0), np.zeros(0))[: 4 if return_points else 2]
+        return tuple(np.concatenate(columns) for columns in zip(*results))
+
+    def _columns(self) -> tuple[Any, Any, Any, Any]:
+        return (self.x1, self.y1, self.x2, self.y2)
+
+
+def _touches_or_crosses(a: tuple[Any, ...], b: tuple[Any, ...]) -> Any:
+    """Vectorized line_segment_touches_or_crosses_line."""
+    # Third party
+    import numpy as np
+
+    ax1, ay1, ax2, ay2 = a
+    cross1 = _cross(ax1, ay1, ax2, ay2, b[0], b[1])
+    cross2 = _cross(ax1, ay1, ax2, ay2, b[2], b[3])
+    return (
+        (np.abs(cross1) < EPSILON)
+        | (np.abs(cross2) < EPSILON)
+        | ((cross1 < 0) ^ (cross2 < 0))
+    )
+
+
+def _intersects(a: tuple[Any, ...], b: tuple[Any, ...]) -> Any:
+    """Vectorized do_lines_intersect of the columns x1, y1, x2, y2."""
+    # Third party
+    import numpy as np
+
+    ax1, ay1, ax2, ay2 = a
+    bx1, by1, bx2, by2 = b
+    boxes_intersect = (
+        (np.minimum(ax1, ax2) <= np.maximum(bx1, bx2))
+        & (np.maximum(ax1, ax2) >= np.minimum(bx1, bx2))
+        & (np.minimum(ay1, ay2) <= np.maximum(by1, by2))
+        & (np.maximum(ay1, ay2) >= np.minimum(by1, by2))
+    )
+    return boxes_intersect & _touches_or_crosses(a, b) & _touches_or_crosses(b, a)
+
+
+def _intersection_points(
+    a: tuple[Any, ...], b: tuple[Any, ...], mask: Any
+) -> tuple[Any, Any]:
+    """Get the crossing points of the lines through a and b where mask is set."""
+    # Third party
+    import numpy as np
+
+    ax1, ay1, ax2, ay2 = a
+    bx1, by1, bx2, by2 = b
+    adx, ady = ax2 - ax1, ay2 - ay1
+    bdx, bdy = bx2 - bx1, by2 - by1
+    denominator = adx * bdy - ady * bdx
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = ((bx1 - ax1) * bdy - (by1 - ay1) * bdx) / denominator
+        x = np.where(mask & (denominator != 0), ax1 + t * adx, np.nan)
+        y = np.where(mask & (denominator != 0), ay1 + t * ady, np.nan)
+    # A segment which is a point is the intersection itself
+    a_is_point = mask & (adx == 0) & (ady == 0)
+    b_is_point = mask & (bdx == 0) & (bdy == 0) & ~a_is_point
+    x = np.where(a_is_point, ax1, np.where(b_is_point, bx1, x))
+    y = np.where(a_is_point, ay1, np.where(b_is_point, by1, y))
+    return x, y
@@ -1,14 +1,38 @@
 """Reading and writing common file formats."""
 
 # Core Library
+import collections.abc
+import contextlib
 import csv
 import hashlib
+import io
 import json
+import keyword
 import os
 import pickle
 import platform
+import shutil
+import struct
+import tempfile
+import threading
+import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 # Third party
 from typing_extensions import Literal
@@ -17,6 +41,138 @@ from typing_extensions import Literal
 from mpu.datastructures import EList
 
 
+class FileFormat(NamedTuple):
+    """
+    A file format which is known to :func:`read` and :func:`write`.
+
+    Parameters
+    ----------
+    name : str
+    extensions : Tuple[str, ...]
+        Lower case file name extensions, including the dot
+    reader : Optional[Callable[[str, Dict], Any]]
+        Gets the filepath and the keyword arguments of :func:`read`
+    writer : Optional[Callable[[str, Any, Dict], Any]]
+        Gets the filepath, the data and the keyword arguments of :func:`write`
+    sniffer : Optional[Callable[[bytes], bool]]
+        Gets the first bytes of a file without extension and checks if the
+        file has this format
+    priority : int
+        Formats with a higher priority are tried first
+    """
+
+    name: str
+    extensions: Tuple[str, ...]
+    reader: Optional[Callable[[str, Dict], Any]]
+    writer: Optional[Callable[[str, Any, Dict], Any]]
+    sniffer: Optional[Callable[[bytes], bool]]
+    priority: int
+
+
+# Sorted by descending priority. Among formats with the same priority, the
+# format which was registered last comes first.
+_FORMATS: List[FileFormat] = []
+
+_SNIFF_SIZE = 65536
+
+
+def register_format(
+    name: str,
+    extensions: Iterable[str] = (),
+    reader: Optional[Callable[[str, Dict], Any]] = None,
+    writer: Optional[Callable[[str, Any, Dict], Any]] = None,
+    sniffer: Optional[Callable[[bytes], bool]] = None,
+    priority: int = 0,
+) -> None:
+    """
+    Make a file format known to :func:`read` and :func:`write`.
+
+    A format with the same name as an existing one replaces it.
+
+    Parameters
+    ----------
+    name : str
+    extensions : Iterable[str]
+    reader : Optional[Callable[[str, Dict], Any]]
+    writer : Optional[Callable[[str, Any, Dict], Any]]
+    sniffer : Optional[Callable[[bytes], bool]]
+    priority : int, optional (default: 0)
+        See :class:`FileFormat`
+
+    Examples
+    --------
+    >>> register_format(  # doctest: +SKIP
+    ...     "text",
+    ...     extensions=[".txt"],
+    ...     reader=lambda filepath, kwargs: open(filepath).read(),
+    ... )
+    """
+    file_format = FileFormat(
+        name,
+        tuple(extension.lower() for extension in extensions),
+        reader,
+        writer,
+        sniffer,
+        priority,
+    )
+    _FORMATS[:] = [other for other in _FORMATS if other.name != name]
+    index = 0
+    while index < len(_FORMATS) and _FORMATS[index].priority > priority:
+        index += 1
+    _FORMATS.insert(index, file_format)
+
+
+def _get_format_by_extension(filepath: str) -> Optional[FileFormat]:
+    lower = filepath.lower()
+    for file_format in _FORMATS:
+        if lower.endswith(file_format.extensions):
+            return file_format
+    return None
+
+
+def _get_format(filepath: str) -> FileFormat:
+    """
+    Find the format of an existing file.
+
+    The format is determined by the file name extension. Only if the file
+    has no extension at all, the content of the file is sniffed.
+    """
+    file_format = _get_format_by_extension(filepath)
+    if file_format is not None:
+        return file_format
+    _raise_if_unsupported(filepath)
+    if os.path.splitext(filepath)[1] == "":
+        with open(filepath, "rb") as fp:
+            head = fp.read(_SNIFF_SIZE)
+        for file_format in _FORMATS:
+            if file_format.sniffer is not None and file_format.sniffer(head):
+                return file_format
+    supported_formats = [ext for f in _FORMATS for ext in f.extensions]
+    raise NotImplementedError(
+        f"File '{filepath}' does not end with one "
+        f"of the supported file name extensions. "
+        f"Supported are: {supported_formats}"
+    )
+
+
+def _raise_if_unsupported(filepath: str) -> None:
+    lower = filepath.lower()
+    if lower.endswith((".yml", ".yaml")):
+        raise NotImplementedError(
+            "YAML is not supported, because you need "
+            "PyYAML in Python3. "
+            "See "
+            "https://stackoverflow.com/a/42054860/562769"
+            " as a guide how to use it."
+        )
+    elif lower.endswith((".h5", ".hdf5")):
+        raise NotImplementedError(
+            "HDF5 is not supported. See "
+            "https://stackoverflow.com/a/41586571/562769"
+            " as a guide how to use it."
+        )
+
+
 def read(filepath: str, **kwargs: Any) -> Any:
     """
     Read a file.
@@ -26,57 +182,86 @@ def read(filepath: str, **kwargs: Any) -> Any:
     * CSV
     * JSON, JSONL
     * pickle
+    * Parquet, Feather / Arrow IPC (requires pyarrow)
+    * GZIP or Zstandard (requires zstandard) compressed files of those formats
+
+    More formats can be added with :func:`register_format`.
 
     Parameters
     ----------
     filepath : str
         Path to the file that should be read. This methods action depends
-        mainly on the file extension.
+        mainly on the file extension. If the file has no extension, the
+        format is guessed from its content.
     kwargs : Dict
         Any keywords for the specific file format. For CSV, this is
-        'delimiter', 'quotechar', 'skiprows', 'format'
+        'delimiter', 'quotechar', 'skiprows', 'format'. With
+        format='columns', the CSV reader additionally accepts 'dtypes' and
+        'backend' (see :func:`_read_csv_columns`). For Parquet, this is
+        'columns', 'filters' and 'row_groups'. For Feather / Arrow IPC, this
+        is 'columns' and 'memory_map'. For pickle, this is
+        'allowed_globals' (see :func:`_read_pickle`).
 
     Returns
     -------
     data : Union[str, bytes] or other (e.g. format=dicts)
     """
-    supported_formats = [".csv", ".json", ".jsonl", ".pickle"]
-    if filepath.lower().endswith(".csv"):
-        return _read_csv(filepath, kwargs)
-    elif filepath.lower().endswith(".json"):
-        with open(filepath, encoding="utf8") as data_file:
-            data: Any = json.load(data_file, **kwargs)
-        return data
-    elif filepath.lower().endswith(".jsonl"):
-        return _read_jsonl(filepath, kwargs)
-    elif filepath.lower().endswith(".pickle"):
-        with open(filepath, "rb") as handle:
-            data_pkl = pickle.load(handle)
-        return data_pkl
-    elif filepath.lower().endswith(".yml") or filepath.lower().endswith(".yaml"):
-        raise NotImplementedError(
-            "YAML is not supported, because you need "
-            "PyYAML in Python3. "
-            "See "
-            "https://stackoverflow.com/a/42054860/562769"
-            " as a guide how to use it."
-        )
-    elif filepath.lower().endswith(".h5") or filepath.lower().endswith(".hdf5"):
-        raise NotImplementedError(
-            "HDF5 is not supported. See "
-            "https://stackoverflow.com/a/41586571/562769"
-            " as a guide how to use it."
-        )
-    else:
-        raise NotImplementedError(
-            f"File '{filepath}' does not end with one "
-            f"of the supported file name extensions. "
-            f"Supported are: {supported_formats}"
-        )
+    file_format = _get_format(filepath)
+    if file_format.reader is None:
+        raise NotImplementedError(f"Reading {file_format.name} is not supported")
+    return file_format.reader(filepath, kwargs)
 
 
-def _read_csv(filepath: str, kwargs: Dict) -> Union[List, Dict]:
+def _read_json(filepath: str, kwargs: Dict) -> Any:
     """See documentation of mpu.io.read."""
+    with open(filepath, encoding="utf8") as data_file:
+        data: Any = json.load(data_file, **kwargs)
+    return data
+
+
+def _read_csv(filepath: str, kwargs: Dict) -> Union[List, Dict]:
+    """
+    See documentation of mpu.io.read.
+
+    With a 'schema', format can also be 'tuples' or 'records'. See
+    :func:`iter_csv`.
+    """
+    format_, skiprows, newline = _pop_csv_kwargs(kwargs)
+    schema = kwargs.pop("schema", None)
+    if schema is not None and format_ not in ["dicts", "tuples", "records"]:
+        raise ValueError(
+            f"A schema is only supported with the formats 'dicts', 'tuples' "
+            f"and 'records', not with format='{format_}'"
+        )
+    with open(filepath, encoding="utf8", newline=newline) as fp:
+        if format_ == "default":
+            reader = csv.reader(fp, **kwargs)
+            data_tmp = EList(list(reader))
+            data: Union[List, Dict] = data_tmp.remove_indices(skiprows)
+        elif format_ == "dicts" and schema is None:
+            reader_list = csv.DictReader(fp, **kwargs)
+            data = list(reader_list)
+        elif format_ in ["dicts", "tuples", "records"]:
+            reader = csv.reader(fp, **kwargs)
+            data = list(_iter_csv_records(reader, skiprows, schema, format_))
+        elif format_ == "columns":
+            dtypes = kwargs.pop("dtypes", None)
+            backend = kwargs.pop("backend", "numpy")
+            reader = csv.reader(fp, **kwargs)
+            data = _read_csv_columns(reader, skiprows, dtypes, backend)
+        else:
+            raise NotImplementedError(f"Format '{format_}' unknown")
+    return data
+
+
+def _pop_csv_kwargs(kwargs: Dict) -> Tuple[str, List[int], Optional[str]]:
+    """
+    Set the CSV defaults and remove the kwargs which csv.reader doesn't know.
+
+    Returns
+    -------
+    format_, skiprows, newline : Tuple[str, List[int], Optional[str]]
+    """
     if "delimiter" not in kwargs:
         kwargs["delimiter"] = ","
     if "quotechar" not in kwargs:
@@ -97,18 +282,340 @@ def _read_csv(filepath: str, kwargs: Dict) -> Union[List, Dict]:
     if "newline" in kwargs:
         newline = kwargs["newline"]
         del kwargs["newline"]
+    return format_, skiprows, newline
 
+
+def iter_csv(
+    filepath: str,
+    schema: Optional[Dict[str, Union[str, Callable[[str], Any]]]] = None,
+    format: Literal["dicts", "tuples", "records"] = "dicts",  # noqa: A002 (as in read)
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """
+    Iterate over the rows of a CSV file as typed records.
+
+    The values are converted once inside the reader, so consumers don't
+    have to convert the strings again.
+
+    Parameters
+    ----------
+    filepath : str
+    schema : Dict[str, Union[str, Callable[[str], Any]]], optional
+        Maps the column names which should be read to a converter. A
+        converter is either a function which gets the string of a cell or
+        one of 'int', 'float', 'bool' and 'str', which use the
+        str2*_or_none functions of :mod:`mpu.string`. Without a schema, all
+        columns are read as strings.
+    format : {'dicts', 'tuples', 'records'}
+        'tuples' have the order of the schema. 'records' are instances of a
+        :class:`Record` class with __slots__, which need much less memory
+        than dicts. Column names which are no valid field names are renamed
+        as in :func:`make_record_class`.
+    kwargs : Dict
+        'delimiter', 'quotechar', 'skiprows' and 'newline' as for
+        :func:`read`
+
+    Yields
+    ------
+    record : Union[Dict, Tuple, Record]
+
+    Raises
+    ------
+    ValueError
+        If a column of the schema is not in the header, a converter name is
+        unknown or a value cannot be converted.
+    """
+    kwargs["format"] = format
+    format_, skiprows, newline = _pop_csv_kwargs(kwargs)
     with open(filepath, encoding="utf8", newline=newline) as fp:
-        if format_ == "default":
-            reader = csv.reader(fp, **kwargs)
-            data_tmp = EList(list(reader))
-            data: Union[List, Dict] = data_tmp.remove_indices(skiprows)
-        elif format_ == "dicts":
-            reader_list = csv.DictReader(fp, **kwargs)
-            data = list(reader_list)
+        reader = csv.reader(fp, **kwargs)
+        yield from _iter_csv_records(reader, skiprows, schema, format_)
+
+
+def _iter_csv_records(
+    reader: Any,
+    skiprows: List[int],
+    schema: Optional[Dict[str, Union[str, Callable[[str], Any]]]],
+    format_: str,
+) -> Iterator[Any]:
+    """See documentation of mpu.io.iter_csv."""
+    if format_ not in ["dicts", "tuples", "records"]:
+        raise NotImplementedError(f"Format '{format_}' unknown")
+    skip = set(skiprows)
+    rows = (row for index, row in enumerate(reader) if index not in skip)
+    header = next(rows, None)
+    if header is None:
+        return
+    if schema is None:
+        schema = {name: "str" for name in header}
+    names = list(schema)
+    plan = _get_schema_plan(header, schema)
+    build: Callable[[List[Any]], Any]
+    if format_ == "dicts":
+        build = lambda values: dict(zip(names, values))  # noqa: E731
+    elif format_ == "tuples":
+        build = tuple
+    else:
+        record_class = make_record_class("CsvRecord", names, rename=True)
+        build = lambda values: record_class(*values)  # noqa: E731
+    for row in rows:
+        try:
+            values = [converter(row[index]) for index, converter in plan]
+        except (ValueError, IndexError) as error:
+            raise ValueError(
+                f"Line {reader.line_num} does not match the schema: {error}"
+            ) from error
+        yield build(values)
+
+
+def _get_schema_plan(
+    header: List[str], schema: Dict[str, Union[str, Callable[[str], Any]]]
+) -> List[Tuple[int, Callable[[str], Any]]]:
+    """Get the (column index, converter) pairs of the schema."""
+    missing = [name for name in schema if name not in header]
+    if missing:
+        raise ValueError(f"The columns {missing} are not in the header {header}")
+    converters = _get_column_converters()
+    unknown = [
+        conv
+        for conv in schema.values()
+        if isinstance(conv, str) and conv not in converters
+    ]
+    if unknown:
+        raise ValueError(
+            f"The converters {unknown} are unknown. "
+            f"Valid converter names are {list(converters)}"
+        )
+    return [
+        (header.index(name), converters[conv] if isinstance(conv, str) else conv)
+        for name, conv in schema.items()
+    ]
+
+
+class Record:
+    """
+    Base class of memory-efficient records.
+
+    Subclasses are created by :func:`make_record_class` and store their
+    fields in __slots__ instead of a __dict__.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __init__(self, *values: Any):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the fields of this record as a dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.as_dict() == other.as_dict()
+
+
+def make_record_class(
+    name: str, fields: Iterable[str], rename: bool = False
+) -> Type[Record]:
+    """
+    Create a :class:`Record` class with the given fields.
+
+    Parameters
+    ----------
+    name : str
+        Name of the class
+    fields : Iterable[str]
+        Python identifiers which are no keywords, don't start with an
+        underscore, don't shadow a method of :class:`Record` and are unique.
+    rename : bool, optional (default: False)
+        As for collections.namedtuple: Replace invalid field names by an
+        underscore and their index instead of raising a ValueError.
+
+    Returns
+    -------
+    record_class : Type[Record]
+
+    Examples
+    --------
+    >>> Point = make_record_class("Point", ["x", "y"])
+    >>> Point(1, 2)
+    Point(x=1, y=2)
+    >>> make_record_class("Person", ["first name", "age"], rename=True)(
+    ...     "Ada", 36
+    ... )
+    Person(_0='Ada', age=36)
+    """
+    field_names: List[str] = []
+    for index, field in enumerate(fields):
+        if not _is_valid_field_name(field) or field in field_names:
+            if not rename:
+                raise ValueError(f"Invalid field name {field!r} for a record")
+            field = f"_{index}"
+        field_names.append(field)
+    return type(name, (Record,), {"__slots__": tuple(field_names)})
+
+
+def _is_valid_field_name(field: str) -> bool:
+    return (
+        field.isidentifier()
+        and not keyword.iskeyword(field)
+        and not field.startswith("_")
+        and not hasattr(Record, field)
+    )
+
+
+def _read_csv_columns(
+    reader: Any,
+    skiprows: List[int],
+    dtypes: Optional[Dict[str, str]],
+    backend: Literal["numpy", "arrow"],
+) -> Dict[str, Any]:
+    """
+    Read a CSV file into one typed array per column.
+
+    The rows are transposed into columns while the file is read, so the file
+    is parsed only once. Afterwards every column is converted with the
+    semantics of :func:`mpu.string.str2int_or_none`,
+    :func:`mpu.string.str2float_or_none` and
+    :func:`mpu.string.str2bool_or_none`, i.e. strings like "" or "null" are
+    missing values.
+
+    Parameters
+    ----------
+    reader : csv.reader
+        The first row which is not skipped is the header. Empty lines are
+        ignored.
+    skiprows : List[int]
+    dtypes : Optional[Dict[str, str]]
+        Map column names to one of 'int', 'float', 'bool', 'str'. Columns
+        which are not given are inferred: The first of int, float, bool
+        which can represent all values is taken, str otherwise.
+    backend : {'numpy', 'arrow'}
+        Return NumPy arrays or pyarrow arrays. Missing values become NaN in
+        NumPy float columns. NumPy int columns with missing values are
+        returned as float columns, bool columns with missing values as
+        object columns. pyarrow supports missing values for all types.
+
+    Returns
+    -------
+    columns : Dict[str, Any]
+        Maps the column name to an array
+
+    Raises
+    ------
+    ValueError
+        If a row has a different number of values than the header.
+    """
+    if backend not in ["numpy", "arrow"]:
+        raise NotImplementedError(f"Backend '{backend}' unknown")
+    if dtypes is None:
+        dtypes = {}
+    header, raw_columns = _transpose_rows(reader, skiprows)
+
+    converters = _get_column_converters()
+    columns = {}
+    for name, raw_values in zip(header, raw_columns):
+        dtype = dtypes.get(name)
+        if dtype is None:
+            dtype, values = _infer_column(raw_values, converters)
+        elif dtype in converters:
+            converter = converters[dtype]
+            values = [converter(value) for value in raw_values]
         else:
-            raise NotImplementedError(f"Format '{format_}' unknown")
-    return data
+            raise NotImplementedError(f"dtype '{dtype}' of column '{name}' unknown")
+        if backend == "numpy":
+            columns[name] = _to_numpy_column(dtype, values)
+        else:
+            columns[name] = _to_arrow_column(dtype, values)
+    return columns
+
+
+def _transpose_rows(
+    reader: Any, skiprows: List[int]
+) -> Tuple[List[str], List[List[str]]]:
+    """Split the rows of reader into the header and the raw columns."""
+    skip = set(skiprows)
+    header: Optional[List[str]] = None
+    raw_columns: List[List[str]] = []
+    for index, row in enumerate(reader):
+        if index in skip:
+            continue
+        if header is None:
+            header = row
+            raw_columns = [[] for _ in header]
+            continue
+        if not row:
+            continue
+        if len(row) != len(header):
+            raise ValueError(
+                f"Line {reader.line_num} has {len(row)} values, "
+                f"but the header has {len(header)} columns"
+            )
+        for column, value in zip(raw_columns, row):
+            column.append(value)
+    return header or [], raw_columns
+
+
+def _get_column_converters() -> Dict[str, Callable[[str], Any]]:
+    """Get the string converters of the columns format by dtype name."""
+    # First party
+    import mpu.string  # mpu.string imports mpu.io
+
+    return {
+        "int": mpu.string.str2int_or_none,
+        "float": mpu.string.str2float_or_none,
+        "bool": mpu.string.str2bool_or_none,
+        "str": mpu.string.str2str_or_none,
+    }
+
+
+def _infer_column(
+    raw_values: List[str], converters: Dict[str, Callable[[str], Any]]
+) -> Tuple[str, List[Any]]:
+    """Find the narrowest dtype which can represent all raw_values."""
+    for dtype in ["int", "float", "bool"]:
+        converter = converters[dtype]
+        with contextlib.suppress(ValueError):
+            return dtype, [converter(value) for value in raw_values]
+    return "str", [converters["str"](value) for value in raw_values]
+
+
+def _to_numpy_column(dtype: str, values: List[Any]) -> Any:
+    """Convert a list of Python values to a NumPy array."""
+    # Third party
+    import numpy as np
+
+    has_missing = any(value is None for value in values)
+    if dtype == "float" or (dtype == "int" and has_missing):
+        return np.array(
+            [np.nan if value is None else value for value in values], dtype=np.float64
+        )
+    elif dtype == "int":
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            return np.array(values, dtype=object)
+    elif dtype == "bool" and not has_missing:
+        return np.array(values, dtype=np.bool_)
+    return np.array(values, dtype=object)
+
+
+def _to_arrow_column(dtype: str, values: List[Any]) -> Any:
+    """Convert a list of Python values to a pyarrow array."""
+    # Third party
+    import pyarrow as pa
+
+    arrow_types = {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "str": pa.string(),
+    }
+    return pa.array(values, type=arrow_types[dtype])
 
 
 def _read_jsonl(filepath: str, kwargs: Dict) -> List:
@@ -118,7 +625,270 @@ def _read_jsonl(filepath: str, kwargs: Dict) -> List:
     return data
 
 
-def write(filepath: str, data: Union[Dict, List], **kwargs: Any) -> Any:
+class JsonlTail:
+    """
+    Read the records which were appended to a growing JSONL file.
+
+    The byte offset after the last complete line is remembered, so every
+    call of :meth:`read_new` only reads the new part of the file. A partial
+    last line is read once it is complete. If the file is rotated (replaced
+    by a new file with the same name) the rest of the old file is read
+    before the new file is read from the start. If the file is truncated, it
+    is read from the start again.
+
+    Parameters
+    ----------
+    filepath : str
+    offset : int, optional (default: 0)
+        Start reading at this byte offset, e.g. a persisted :attr:`offset`
+    use_inotify : bool, optional (default: False)
+        Let :meth:`follow` wait for inotify events of the directory instead
+        of sleeping. Only available on Linux.
+    kwargs : Dict
+        Passed to json.loads
+
+    Examples
+    --------
+    >>> with JsonlTail("service.log.jsonl") as tail:  # doctest: +SKIP
+    ...     for record in tail.follow(poll_interval=0.5):
+    ...         print(record)
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        offset: int = 0,
+        use_inotify: bool = False,
+        **kwargs: Any,
+    ):
+        self.filepath = filepath
+        self.offset = offset
+        self._kwargs = kwargs
+        self._fp: Optional[Any] = None
+        self._inotify_fd: Optional[int] = None
+        if use_inotify:
+            self._inotify_fd = _inotify_watch(os.path.dirname(filepath) or ".")
+
+    def read_new(self) -> List[Any]:
+        """
+        Read the complete records which were appended since the last call.
+
+        Returns
+        -------
+        records : List[Any]
+        """
+        if self._fp is None:
+            try:
+                # Stays open between calls, it is closed by close()
+                self._fp = open(self.filepath, "rb")  # noqa: SIM115
+            except FileNotFoundError:
+                return []
+        if os.fstat(self._fp.fileno()).st_size < self.offset:
+            self.offset = 0  # truncated
+        records = self._read_complete_lines()
+        try:
+            rotated = (
+                os.stat(self.filepath).st_ino != os.fstat(self._fp.fileno()).st_ino
+            )
+        except FileNotFoundError:
+            rotated = False  # the new file was not created yet
+        if rotated:
+            self._fp.close()
+            self._fp = None
+            self.offset = 0
+            records += self.read_new()
+        return records
+
+    def follow(
+        self, poll_interval: float = 1.0, idle_timeout: Optional[float] = None
+    ) -> Iterator[Any]:
+        """
+        Yield the records of the file and wait for new ones.
+
+        Parameters
+        ----------
+        poll_interval : float, optional (default: 1.0)
+            Seconds to wait for new records. With inotify, this is the
+            maximum time to wait for an event.
+        idle_timeout : Optional[float]
+            Stop if there were no new records for this many seconds. By
+            default, wait forever.
+
+        Yields
+        ------
+        record : Any
+        """
+        # Core Library
+        import time
+
+        last_record_time = time.monotonic()
+        while True:
+            records = self.read_new()
+            yield from records
+            if records:
+                last_record_time = time.monotonic()
+            elif (
+                idle_timeout is not None
+                and time.monotonic() - last_record_time >= idle_timeout
+            ):
+                return
+            self._wait(poll_interval)
+
+    def close(self) -> None:
+        """Close the file and the inotify watch."""
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+
+    def __enter__(self) -> "JsonlTail":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _read_complete_lines(self) -> List[Any]:
+        assert self._fp is not None
+        self._fp.seek(self.offset)
+        data = self._fp.read()
+        end = data.rfind(b"\n") + 1
+        self.offset += end
+        return [
+            json.loads(line, **self._kwargs)
+            for line in data[:end].split(b"\n")
+            if line.strip()
+        ]
+
+    def _wait(self, timeout: float) -> None:
+        # Core Library
+        import select
+        import time
+
+        if self._inotify_fd is None:
+            time.sleep(timeout)
+            return
+        readable, _, _ = select.select([self._inotify_fd], [], [], timeout)
+        if readable:
+            os.read(self._inotify_fd, 65536)  # the events are not needed
+
+
+def _inotify_watch(directory: str) -> int:
+    """Get an inotify file descriptor for changes in directory."""
+    # Core Library
+    import ctypes
+    import ctypes.util
+
+    in_modify, in_moved_to, in_create = 0x2, 0x80, 0x100
+    in_cloexec, in_nonblock = 0o2000000, 0o4000
+    if platform.system() != "Linux":
+        raise NotImplementedError("inotify is only available on Linux")
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    fd = libc.inotify_init1(in_cloexec | in_nonblock)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+    mask = in_modify | in_moved_to | in_create
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        errno = ctypes.get_errno()
+        os.close(fd)
+        raise OSError(errno, f"inotify_add_watch failed for '{directory}'")
+    return fd
+
+
+def _read_pickle(filepath: str, kwargs: Dict) -> Any:
+    """
+    See documentation of mpu.io.read.
+
+    Files which were written with out_of_band=True are memory-mapped and
+    their buffers are passed to the unpickler without copying them. The
+    memory-map is copy-on-write: Changing loaded arrays does not change the
+    file.
+
+    Pickle files can execute arbitrary code while being loaded. For files
+    from untrusted sources, pass 'allowed_globals', e.g.
+    ``allowed_globals=["collections.OrderedDict"]``. Loading any other class
+    or function raises a pickle.UnpicklingError.
+    """
+    # Core Library
+    import mmap
+
+    allowed_globals = kwargs.pop("allowed_globals", None)
+    with open(filepath, "rb") as handle:
+        if handle.read(len(_OUT_OF_BAND_MAGIC)) != _OUT_OF_BAND_MAGIC:
+            handle.seek(0)
+            return _get_unpickler(handle, allowed_globals, None).load()
+        if pickle.HIGHEST_PROTOCOL < 5:
+            raise ValueError(
+                f"{filepath} was written with out_of_band=True, which requires "
+                "pickle protocol 5. It is only available since Python 3.8"
+            )
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapped)
+    offset = len(_OUT_OF_BAND_MAGIC)
+    pickle_length, nb_buffers = struct.unpack_from("<QQ", mapped, offset)
+    offset += 16
+    buffers = []
+    for _ in range(nb_buffers):
+        buffer_offset, buffer_length = struct.unpack_from("<QQ", mapped, offset)
+        offset += 16
+        buffers.append(view[buffer_offset : buffer_offset + buffer_length])
+    pickled = view[offset : offset + pickle_length]
+    unpickler = _get_unpickler(io.BytesIO(pickled), allowed_globals, buffers)
+    return unpickler.load()
+
+
+def _get_unpickler(
+    file: Any, allowed_globals: Optional[Iterable[str]], buffers: Optional[List]
+) -> pickle.Unpickler:
+    """Get an Unpickler which only loads allowed_globals, if given."""
+    kwargs: Dict[str, Any] = {} if buffers is None else {"buffers": buffers}
+    if allowed_globals is None:
+        return pickle.Unpickler(file, **kwargs)
+    return _RestrictedUnpickler(file, set(allowed_globals), **kwargs)
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """Unpickler which only loads the given 'module.name' globals."""
+
+    def __init__(self, file: Any, allowed_globals: Set[str], **kwargs: Any):
+        super().__init__(file, **kwargs)
+        self.allowed_globals = allowed_globals
+
+    def find_class(self, module: str, name: str) -> Any:
+        if f"{module}.{name}" not in self.allowed_globals:
+            raise pickle.UnpicklingError(f"'{module}.{name}' is not allowed")
+        return super().find_class(module, name)
+
+
+def _read_parquet(filepath: str, kwargs: Dict) -> Any:
+    """
+    See documentation of mpu.io.read.
+
+    Only the given 'columns' are read. 'filters' skips row groups based on
+    their statistics, e.g. ``filters=[("year", ">=", 2020)]``. Alternatively,
+    the indices of the 'row_groups' can be given directly.
+    """
+    # Third party
+    import pyarrow.parquet as pq
+
+    row_groups = kwargs.pop("row_groups", None)
+    if row_groups is not None:
+        return pq.ParquetFile(filepath).read_row_groups(row_groups, **kwargs)
+    return pq.read_table(filepath, **kwargs)
+
+
+def _read_feather(filepath: str, kwargs: Dict) -> Any:
+    """See documentation of mpu.io.read."""
+    # Third party
+    import pyarrow.feather as feather
+
+    return feather.read_table(filepath, **kwargs)
+
+
+def write(
+    filepath: str, data: Union[Dict, List], atomic: bool = False, **kwargs: Any
+) -> Any:
     """
     Write a file.
 
@@ -127,15 +897,24 @@ def write(filepath: str, data: Union[Dict, List], **kwargs: Any) -> Any:
     * CSV
     * JSON, JSONL
     * pickle
+    * Parquet, Feather / Arrow IPC (requires pyarrow)
+    * GZIP or Zstandard (requires zstandard) compressed files of those formats
+
+    More formats can be added with :func:`register_format`.
 
     Parameters
     ----------
     filepath : str
         Path to the file that should be read. This methods action depends
         mainly on the file extension. Make sure that it ends in .csv, .json,
-        .jsonl, or .pickle.
+        .jsonl, .pickle, .parquet, .feather or .arrow, optionally followed by
+        .gz or .zst.
     data : Union[Dict, List]
         Content that should be written
+    atomic : bool, optional (default: False)
+        Write to a temporary file in the same directory first and move it to
+        filepath once it is completely written and synced to disk. Readers
+        will see either the old or the new file, never a truncated one.
     kwargs : Dict
         Any keywords for the specific file format.
 
@@ -143,34 +922,92 @@ def write(filepath: str, data: Union[Dict, List], **kwargs: Any) -> Any:
     -------
     data : str or bytes
     """
-    supported_formats = [".csv", ".json", ".jsonl", ".pickle"]
-    if filepath.lower().endswith(".csv"):
-        return _write_csv(filepath, data, kwargs)
-    elif filepath.lower().endswith(".json"):
-        return _write_json(filepath, data, kwargs)
-    elif filepath.lower().endswith(".jsonl"):
-        return _write_jsonl(filepath, data, kwargs)
-    elif filepath.lower().endswith(".pickle"):
-        return _write_pickle(filepath, data, kwargs)
-    elif filepath.lower().endswith(".yml") or filepath.lower().endswith(".yaml"):
-        raise NotImplementedError(
-            "YAML is not supported, because you need "
-            "PyYAML in Python3. "
-            "See "
-            "https://stackoverflow.com/a/42054860/562769"
-            " as a guide how to use it."
-        )
-    elif filepath.lower().endswith(".h5") or filepath.lower().endswith(".hdf5"):
-        raise NotImplementedError(
-            "HDF5 is not supported. See "
-            "https://stackoverflow.com/a/41586571/562769"
-            " as a guide how to use it."
-        )
-    else:
+    if atomic:
+        with atomic_path(filepath) as tmp_path:
+            return write(tmp_path, data, **kwargs)
+    file_format = _get_format_by_extension(filepath)
+    if file_format is None:
+        _raise_if_unsupported(filepath)
+        supported_formats = [ext for f in _FORMATS for ext in f.extensions]
         raise NotImplementedError(
             f"File '{filepath}' does not end in one of the "
             f"supported formats. Supported are: {supported_formats}"
         )
+    if file_format.writer is None:
+        raise NotImplementedError(f"Writing {file_format.name} is not supported")
+    return file_format.writer(filepath, data, kwargs)
+
+
+@contextlib.contextmanager
+def atomic_path(filepath: str) -> Iterator[str]:
+    """
+    Get a temporary path which replaces filepath once the block succeeds.
+
+    Readers of filepath never see a partially written file. The temporary
+    file is in the same directory as filepath, because os.replace is only
+    atomic within one file system. It ends with the basename of filepath so
+    that the dispatch by file extension still works. If the block fails,
+    the temporary file is removed and filepath is not touched.
+
+    Parameters
+    ----------
+    filepath : str
+        The file which should be written
+
+    Yields
+    ------
+    tmp_path : str
+        The path which should be written in the block
+
+    Examples
+    --------
+    >>> with atomic_path("primes.txt") as tmp_path:  # doctest: +SKIP
+    ...     with open(tmp_path, "w") as fp:
+    ...         fp.write("2 3 5 7")
+    """
+    directory, basename = os.path.split(os.path.abspath(filepath))
+    tmp_path = os.path.join(directory, f".{uuid.uuid4().hex}.{basename}")
+    try:
+        yield tmp_path
+        with open(tmp_path, "rb") as fp:
+            os.fsync(fp.fileno())
+        if os.path.exists(filepath):
+            shutil.copymode(filepath, tmp_path)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if platform.system() != "Windows":
+        # Persist the directory entry of the renamed file
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+@contextlib.asynccontextmanager
+async def _async_atomic_path(filepath: str) -> AsyncIterator[str]:
+    """
+    Get a temporary path like :func:`atomic_path` in a coroutine.
+
+    The fsync and the rename block, so they run in the default executor.
+    """
+    # Core Library
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    manager = atomic_path(filepath)
+    tmp_path = manager.__enter__()
+    try:
+        yield tmp_path
+    except BaseException as error:
+        await loop.run_in_executor(
+            None, manager.__exit__, type(error), error, error.__traceback__
+        )
+        raise
+    await loop.run_in_executor(None, manager.__exit__, None, None, None)
 
 
 def _write_csv(filepath: str, data: Any, kwargs: Dict) -> Any:
@@ -223,7 +1060,16 @@ def _write_jsonl(filepath: str, data: Any, kwargs: Dict) -> Any:
 
 
 def _write_pickle(filepath: str, data: Any, kwargs: Dict) -> Any:
-    """See documentation of mpu.io.write."""
+    """
+    See documentation of mpu.io.write.
+
+    With out_of_band=True, pickle protocol 5 stores large buffers (e.g. of
+    NumPy arrays) outside of the pickle stream. They are written as aligned
+    segments after the pickle stream, so that reading the file can
+    memory-map them instead of copying them.
+    """
+    if kwargs.pop("out_of_band", False):
+        return _write_pickle_out_of_band(filepath, data, kwargs)
     if "protocol" not in kwargs:
         kwargs["protocol"] = pickle.HIGHEST_PROTOCOL
     with open(filepath, "wb") as handle:
@@ -231,7 +1077,130 @@ def _write_pickle(filepath: str, data: Any, kwargs: Dict) -> Any:
     return data
 
 
-def urlread(url: str, encoding: str = "utf8") -> str:
+# Layout of out-of-band pickle files:
+# magic, pickle length, number of buffers, (offset, length) of every buffer,
+# the pickle stream, the buffers. All integers are unsigned little-endian
+# 8 byte integers.
+_OUT_OF_BAND_MAGIC = b"MPUPKL5\n"
+_OUT_OF_BAND_ALIGNMENT = 64
+
+
+def _write_pickle_out_of_band(filepath: str, data: Any, kwargs: Dict) -> Any:
+    """See documentation of mpu.io._write_pickle."""
+    if pickle.HIGHEST_PROTOCOL < 5:
+        raise ValueError(
+            "out_of_band=True requires pickle protocol 5, which is only "
+            "available since Python 3.8"
+        )
+    kwargs["protocol"] = 5
+    buffers: List[Any] = []
+    pickled = pickle.dumps(data, buffer_callback=buffers.append, **kwargs)
+    raws = [buffer.raw() for buffer in buffers]
+
+    header_length = len(_OUT_OF_BAND_MAGIC) + 16 + 16 * len(raws)
+    offset = header_length + len(pickled)
+    layout = []
+    for raw in raws:
+        offset += -offset % _OUT_OF_BAND_ALIGNMENT
+        layout.append((offset, raw.nbytes))
+        offset += raw.nbytes
+
+    with open(filepath, "wb") as handle:
+        handle.write(_OUT_OF_BAND_MAGIC)
+        handle.write(struct.pack("<QQ", len(pickled), len(raws)))
+        for buffer_offset, buffer_length in layout:
+            handle.write(struct.pack("<QQ", buffer_offset, buffer_length))
+        handle.write(pickled)
+        for (buffer_offset, _), raw in zip(layout, raws):
+            handle.write(b"\0" * (buffer_offset - handle.tell()))
+            handle.write(raw)
+    return data
+
+
+def _to_arrow_table(data: Any) -> Any:
+    """Convert a pyarrow Table, a dict of columns or a list of dicts."""
+    # Third party
+    import pyarrow as pa
+
+    if isinstance(data, pa.Table):
+        return data
+    elif isinstance(data, pa.RecordBatch):
+        return pa.Table.from_batches([data])
+    elif isinstance(data, dict):
+        return pa.table(data)
+    else:
+        return pa.Table.from_pylist(list(data))
+
+
+def _iter_arrow_tables(data: Any) -> Iterator[Any]:
+    """
+    Get the chunks which are written one after another.
+
+    An iterator (e.g. a generator) is a stream of chunks. Everything else is
+    a single chunk.
+    """
+    if isinstance(data, collections.abc.Iterator):
+        for chunk in data:
+            yield _to_arrow_table(chunk)
+    else:
+        yield _to_arrow_table(data)
+
+
+def _write_parquet(filepath: str, data: Any, kwargs: Dict) -> Any:
+    """
+    See documentation of mpu.io.write.
+
+    data can be a pyarrow Table, a dict of columns, a list of dicts or an
+    iterator of those. Every chunk of an iterator is written as its own
+    row group(s) as soon as it arrives, so the complete data never has to be
+    in memory. The kwargs are passed to pyarrow.parquet.ParquetWriter,
+    except for 'row_group_size'.
+    """
+    # Third party
+    import pyarrow.parquet as pq
+
+    row_group_size = kwargs.pop("row_group_size", None)
+    writer = None
+    try:
+        for table in _iter_arrow_tables(data):
+            if writer is None:
+                writer = pq.ParquetWriter(filepath, table.schema, **kwargs)
+            writer.write_table(table, row_group_size=row_group_size)
+    finally:
+        if writer is not None:
+            writer.close()
+    return data
+
+
+def _write_feather(filepath: str, data: Any, kwargs: Dict) -> Any:
+    """
+    See documentation of mpu.io.write.
+
+    Feather version 2 is the Arrow IPC file format. data is handled as in
+    :func:`_write_parquet`; every chunk becomes one or more record batches.
+    The kwargs are passed to pyarrow.ipc.IpcWriteOptions, e.g.
+    compression='zstd'.
+    """
+    # Third party
+    import pyarrow as pa
+
+    options = pa.ipc.IpcWriteOptions(**kwargs)
+    writer = None
+    with pa.OSFile(filepath, "wb") as sink:
+        try:
+            for table in _iter_arrow_tables(data):
+                if writer is None:
+                    writer = pa.ipc.new_file(sink, table.schema, options=options)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+    return data
+
+
+def urlread(
+    url: str, encoding: str = "utf8", downloader: Optional["Downloader"] = None
+) -> str:
     """
     Read the content of an URL.
 
@@ -239,11 +1208,16 @@ def urlread(url: str, encoding: str = "utf8") -> str:
     ----------
     url : str
     encoding : str (default: "utf8")
+    downloader : Downloader, optional
+        Re-use the keep-alive connections of this downloader.
 
     Returns
     -------
     content : str
     """
+    if downloader is not None:
+        return downloader.urlread(url, encoding)
+
     # Core Library
     from urllib.request import urlopen
 
@@ -253,7 +1227,9 @@ def urlread(url: str, encoding: str = "utf8") -> str:
     return content
 
 
-def download(source: str, sink: Optional[str] = None) -> str:
+def download(
+    source: str, sink: Optional[str] = None, downloader: Optional["Downloader"] = None
+) -> str:
     """
     Download a file.
 
@@ -263,7 +1239,13 @@ def download(source: str, sink: Optional[str] = None) -> str:
         Where the file comes from. Some URL.
     sink : str, optional (default: same filename in current directory)
         Where the file gets stored. Some filepath in the local file system.
+    downloader : Downloader, optional
+        Download the file with this downloader, i.e. with parallel segments,
+        resuming a previous partial download and re-using connections.
     """
+    if downloader is not None:
+        return downloader.download(source, sink)
+
     # Core Library
     from urllib.request import urlretrieve
 
@@ -273,8 +1255,383 @@ def download(source: str, sink: Optional[str] = None) -> str:
     return sink
 
 
+def create_async_session(
+    limit: int = 100, limit_per_host: int = 8, timeout: Optional[float] = 60
+) -> Any:
+    """
+    Create an aiohttp session for :func:`aurlread` and :func:`adownload`.
+
+    The session keeps a pool of keep-alive connections. It has to be created
+    and closed within the running event loop.
+
+    Parameters
+    ----------
+    limit : int, optional (default: 100)
+        Maximum number of simultaneous connections
+    limit_per_host : int, optional (default: 8)
+        Maximum number of simultaneous connections to the same host
+    timeout : Optional[float], optional (default: 60)
+        Total timeout of a request in seconds. None means no timeout.
+
+    Returns
+    -------
+    session : aiohttp.ClientSession
+
+    Examples
+    --------
+    >>> async def main(urls):  # doctest: +SKIP
+    ...     async with create_async_session(limit_per_host=2) as session:
+    ...         return await asyncio.gather(
+    ...             *[aurlread(url, session=session) for url in urls]
+    ...         )
+    """
+    # Third party
+    import aiohttp
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        raise_for_status=True,
+    )
+
+
+async def aurlread(url: str, encoding: str = "utf8", session: Any = None) -> str:
+    """
+    Read the content of an URL asynchronously.
+
+    Parameters
+    ----------
+    url : str
+    encoding : str (default: "utf8")
+    session : aiohttp.ClientSession, optional
+        See :func:`create_async_session`. Without a session, a new
+        connection is opened for this request.
+
+    Returns
+    -------
+    content : str
+    """
+    if session is None:
+        async with create_async_session() as session:
+            return await aurlread(url, encoding, session)
+    async with session.get(url) as response:
+        content = await response.read()
+    return content.decode(encoding)
+
+
+async def adownload(
+    source: str,
+    sink: Optional[str] = None,
+    session: Any = None,
+    chunk_size: int = 65536,
+) -> str:
+    """
+    Download a file asynchronously.
+
+    The body is streamed to the disk in chunks, so it is never completely in
+    memory. sink only appears once the download is complete. The file system
+    calls run in the default executor, so they don't block the event loop.
+
+    Parameters
+    ----------
+    source : str
+        Where the file comes from. Some URL.
+    sink : str, optional (default: same filename in current directory)
+        Where the file gets stored. Some filepath in the local file system.
+    session : aiohttp.ClientSession, optional
+        See :func:`create_async_session`
+    chunk_size : int, optional (default: 65536 byte = 64 KiB)
+
+    Returns
+    -------
+    sink : str
+    """
+    # Core Library
+    import asyncio
+    from urllib.parse import urlsplit
+
+    if session is None:
+        async with create_async_session() as session:
+            return await adownload(source, sink, session, chunk_size)
+    if sink is None:
+        sink = os.path.abspath(os.path.basename(urlsplit(source).path))
+    loop = asyncio.get_running_loop()
+    async with session.get(source) as response:
+        async with _async_atomic_path(sink) as tmp_path:
+            fp = await loop.run_in_executor(None, open, tmp_path, "wb")
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    await loop.run_in_executor(None, fp.write, chunk)
+            finally:
+                await loop.run_in_executor(None, fp.close)
+    return sink
+
+
+class Downloader:
+    """
+    Download HTTP(S) resources over re-used keep-alive connections.
+
+    Files are downloaded in parallel segments via HTTP range requests if the
+    server supports them. Every segment is stored in a ``<sink>.part<i>``
+    file until the download is complete, so an interrupted download is
+    resumed by calling :meth:`download` again. Resuming assumes that the
+    remote file did not change in between.
+
+    Parameters
+    ----------
+    segments : int, optional (default: 4)
+        Maximum number of parallel segments per file
+    min_segment_size : int, optional (default: 1048576 byte = 1 MiB)
+        Files are only split into segments of at least this size
+    timeout : float, optional (default: 60)
+        Socket timeout in seconds
+    max_redirects : int, optional (default: 5)
+
+    Examples
+    --------
+    >>> with Downloader() as downloader:  # doctest: +SKIP
+    ...     path = downloader.download("https://example.com/big.csv")
+    """
+
+    def __init__(
+        self,
+        segments: int = 4,
+        min_segment_size: int = 1048576,
+        timeout: float = 60,
+        max_redirects: int = 5,
+    ):
+        self.segments = segments
+        self.min_segment_size = min_segment_size
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], List[Any]] = {}
+
+    def urlread(self, url: str, encoding: str = "utf8") -> str:
+        """See documentation of mpu.io.urlread."""
+        with self._request(url) as response:
+            return response.read().decode(encoding)
+
+    def download(self, source: str, sink: Optional[str] = None) -> str:
+        """See documentation of mpu.io.download."""
+        # Core Library
+        from concurrent.futures import ThreadPoolExecutor
+        from urllib.parse import urlsplit
+
+        if sink is None:
+            sink = os.path.abspath(os.path.basename(urlsplit(source).path))
+        segments = self._get_segments(source)
+        part_paths = [f"{sink}.part{i}" for i in range(len(segments))]
+        with ThreadPoolExecutor(max_workers=max(len(segments), 1)) as executor:
+            # list() re-raises exceptions of the segments
+            list(
+                executor.map(
+                    lambda args: self._download_segment(source, *args),
+                    [(path, *segment) for path, segment in zip(part_paths, segments)],
+                )
+            )
+        with atomic_path(sink) as tmp_path, open(tmp_path, "wb") as f_out:
+            for part_path in part_paths:
+                with open(part_path, "rb") as f_in:
+                    shutil.copyfileobj(f_in, f_out)
+        for part_path in part_paths:
+            os.remove(part_path)
+        return sink
+
+    def download_many(
+        self,
+        sources: Iterable[str],
+        sink_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """
+        Download many files concurrently.
+
+        Parameters
+        ----------
+        sources : Iterable[str]
+            URLs. A URL which is given several times is downloaded once.
+        sink_dir : str, optional (default: current directory)
+            The files are stored with their name in this directory.
+        max_workers : Optional[int]
+            Number of files which are downloaded at the same time.
+
+        Returns
+        -------
+        sinks : Dict[str, str]
+            Maps the source URL to the local filepath
+
+        Raises
+        ------
+        ValueError
+            If different URLs have the same file name, before anything is
+            downloaded.
+        """
+        # Core Library
+        from concurrent.futures import ThreadPoolExecutor
+        from urllib.parse import urlsplit
+
+        if sink_dir is None:
+            sink_dir = os.getcwd()
+        sources = list(dict.fromkeys(sources))
+        sinks = [
+            os.path.join(sink_dir, os.path.basename(urlsplit(source).path))
+            for source in sources
+        ]
+        sources_by_sink: Dict[str, List[str]] = {}
+        for source, sink in zip(sources, sinks):
+            sources_by_sink.setdefault(sink, []).append(source)
+        duplicates = {
+            sink: urls for sink, urls in sources_by_sink.items() if len(urls) > 1
+        }
+        if duplicates:
+            raise ValueError(f"Different sources have the same sink: {duplicates}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(sources, executor.map(self.download, sources, sinks)))
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            for connections in self._idle.values():
+                for connection in connections:
+                    connection.close()
+            self._idle = {}
+
+    def __enter__(self) -> "Downloader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _get_segments(self, url: str) -> List[Tuple[int, Optional[int]]]:
+        """
+        Split the resource into (first byte, last byte) segments.
+
+        If the server does not support range requests, there is only a single
+        segment (0, None).
+        """
+        # Core Library
+        from urllib.error import HTTPError
+
+        try:
+            with self._request(url, method="HEAD") as response:
+                size = response.getheader("Content-Length")
+                accept_ranges = response.getheader("Accept-Ranges", "none")
+                response.read()
+        except HTTPError:
+            # Some servers don't support HEAD requests
+            return [(0, None)]
+        if size is None or accept_ranges.lower() != "bytes":
+            return [(0, None)]
+        size_int = int(size)
+        nb_segments = max(1, min(self.segments, size_int // self.min_segment_size))
+        starts = [size_int * i // nb_segments for i in range(nb_segments + 1)]
+        return [
+            (start, end - 1) for start, end in zip(starts, starts[1:]) if end > start
+        ]
+
+    def _download_segment(
+        self, url: str, part_path: str, first: int, last: Optional[int]
+    ) -> None:
+        """Download the bytes first..last of url, continuing part_path."""
+        headers = {}
+        mode = "wb"
+        if last is not None:
+            done = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if done == last - first + 1:
+                return
+            if done < last - first + 1:
+                first += done
+                mode = "ab"
+            headers["Range"] = f"bytes={first}-{last}"
+        with self._request(url, headers=headers) as response:
+            if last is not None and response.status != 206:
+                raise OSError(f"The server ignored the range request for '{url}'")
+            with open(part_path, mode) as fp:
+                shutil.copyfileobj(response, fp)
+
+    @contextlib.contextmanager
+    def _request(
+        self, url: str, method: str = "GET", headers: Optional[Dict[str, str]] = None
+    ) -> Iterator[Any]:
+        """
+        Send a request and follow redirects.
+
+        The connection goes back to the pool of idle connections if the
+        response was read completely.
+        """
+        # Core Library
+        from urllib.error import HTTPError
+        from urllib.parse import urljoin
+
+        for _ in range(self.max_redirects + 1):
+            key, connection, response = self._send(url, method, headers or {})
+            location = response.getheader("Location")
+            if response.status in [301, 302, 303, 307, 308] and location:
+                response.read()
+                self._release(key, connection)
+                url = urljoin(url, location)
+                continue
+            if response.status >= 400:
+                response.read()
+                self._release(key, connection)
+                raise HTTPError(
+                    url, response.status, response.reason, response.headers, None
+                )
+            try:
+                yield response
+            finally:
+                if not response.isclosed():
+                    connection.close()
+                self._release(key, connection)
+            return
+        raise OSError(f"Too many redirects for '{url}'")
+
+    def _send(
+        self, url: str, method: str, headers: Dict[str, str]
+    ) -> Tuple[Tuple[str, str], Any, Any]:
+        """Send a request, re-trying once if an idle connection went stale."""
+        # Core Library
+        import http.client
+        from urllib.parse import urlsplit
+
+        parts = urlsplit(url)
+        if parts.scheme not in ["http", "https"]:
+            raise NotImplementedError(f"Only HTTP(S) is supported, but got '{url}'")
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        with self._lock:
+            idle = self._idle.get(key, [])
+            connection = idle.pop() if idle else None
+        if connection is not None:
+            try:
+                connection.request(method, path, headers=headers)
+                return key, connection, connection.getresponse()
+            except (OSError, http.client.HTTPException):
+                # The server closed the idle connection
+                connection.close()
+        if parts.scheme == "https":
+            connection = http.client.HTTPSConnection(parts.netloc, timeout=self.timeout)
+        else:
+            connection = http.client.HTTPConnection(parts.netloc, timeout=self.timeout)
+        connection.request(method, path, headers=headers)
+        return key, connection, connection.getresponse()
+
+    def _release(self, key: Tuple[str, str], connection: Any) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(connection)
+
+
+HashMethod = Literal["sha1", "md5", "sha256", "blake2b", "xxh64", "xxh3_64", "xxh3_128"]
+
+
 def hash(
-    filepath: str, method: Literal["sha1", "md5"] = "sha1", buffer_size: int = 65536
+    filepath: str,
+    method: HashMethod = "sha1",
+    buffer_size: int = 1048576,
+    cache: Optional["HashCache"] = None,
 ) -> str:
     """
     Calculate a hash of a local file.
@@ -282,30 +1639,230 @@ def hash(
     Parameters
     ----------
     filepath : str
-    method : {'sha1', 'md5'}
-    buffer_size : int, optional (default: 65536 byte = 64 KiB)
+    method : {'sha1', 'md5', 'sha256', 'blake2b', 'xxh64', 'xxh3_64', 'xxh3_128'}
+        The xxhash methods require the xxhash package.
+    buffer_size : int, optional (default: 1048576 byte = 1 MiB)
         in byte
+    cache : HashCache, optional
+        Return the stored hash if the file did not change since it was
+        hashed the last time.
 
     Returns
     -------
     hash : str
     """
-    if method == "sha1":
-        hash_function = hashlib.sha1()
-    elif method == "md5":
-        hash_function = hashlib.md5()
-    else:
-        raise NotImplementedError(
-            f"Only md5 and sha1 hashes are known, but '{method}' was specified."
-        )
+    if cache is not None:
+        return cache.hash(filepath, method, buffer_size)
+    return hashes(filepath, [method], buffer_size)[method]
 
-    with open(filepath, "rb") as fp:
+
+def hashes(
+    filepath: str, methods: Iterable[HashMethod], buffer_size: int = 1048576
+) -> Dict[str, str]:
+    """
+    Calculate several hashes of a local file while reading it only once.
+
+    Parameters
+    ----------
+    filepath : str
+    methods : Iterable[HashMethod]
+        See :func:`hash`
+    buffer_size : int, optional (default: 1048576 byte = 1 MiB)
+        in byte
+
+    Returns
+    -------
+    hashes : Dict[str, str]
+        Maps the method to the hex digest
+    """
+    hash_functions = {method: _get_hash_function(method) for method in methods}
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(filepath, "rb", buffering=0) as fp:
         while True:
-            data = fp.read(buffer_size)
-            if not data:
+            size = fp.readinto(buffer)
+            if not size:
                 break
-            hash_function.update(data)
-    return hash_function.hexdigest()
+            for hash_function in hash_functions.values():
+                hash_function.update(view[:size])
+    return {
+        method: hash_function.hexdigest()
+        for method, hash_function in hash_functions.items()
+    }
+
+
+def hash_many(
+    filepaths: Iterable[str],
+    method: HashMethod = "sha1",
+    buffer_size: int = 1048576,
+    max_workers: Optional[int] = None,
+    cache: Optional["HashCache"] = None,
+) -> Dict[str, str]:
+    """
+    Calculate the hashes of many local files concurrently.
+
+    hashlib releases the GIL while hashing, so threads make use of several
+    cores and overlap the reading of the files.
+
+    Parameters
+    ----------
+    filepaths : Iterable[str]
+    method : HashMethod
+        See :func:`hash`
+    buffer_size : int, optional (default: 1048576 byte = 1 MiB)
+        in byte
+    max_workers : Optional[int]
+        Number of threads. See concurrent.futures.ThreadPoolExecutor
+    cache : HashCache, optional
+        See :func:`hash`
+
+    Returns
+    -------
+    hashes : Dict[str, str]
+        Maps the filepath to the hex digest
+    """
+    # Core Library
+    from concurrent.futures import ThreadPoolExecutor
+
+    _get_hash_function(method)  # fail early for unknown methods
+    filepaths = list(filepaths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests = executor.map(
+            lambda filepath: hash(filepath, method, buffer_size, cache), filepaths
+        )
+        return dict(zip(filepaths, digests))
+
+
+class HashCache:
+    """
+    Persistent cache of file hashes.
+
+    The hashes are stored in an SQLite database. An entry is only used if the
+    size, the modification time and the inode of the file did not change
+    since the file was hashed. The cache can be shared by several threads.
+
+    Parameters
+    ----------
+    db_path : str
+        Path of the SQLite database. It is created if it does not exist.
+
+    Examples
+    --------
+    >>> with HashCache(":memory:") as cache:
+    ...     digest = hash(__file__, cache=cache)
+    """
+
+    def __init__(self, db_path: str):
+        # Core Library
+        import sqlite3
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                "path TEXT NOT NULL, method TEXT NOT NULL, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, inode INTEGER NOT NULL, "
+                "digest TEXT NOT NULL, PRIMARY KEY (path, method))"
+            )
+
+    def hash(
+        self, filepath: str, method: HashMethod = "sha1", buffer_size: int = 1048576
+    ) -> str:
+        """
+        Get the hash of a local file, only hashing it if it changed.
+
+        Parameters
+        ----------
+        filepath : str
+        method : HashMethod
+            See :func:`mpu.io.hash`
+        buffer_size : int, optional (default: 1048576 byte = 1 MiB)
+
+        Returns
+        -------
+        hash : str
+        """
+        path = os.path.abspath(filepath)
+        key = self._stat_key(path)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size, mtime_ns, inode, digest FROM hashes "
+                "WHERE path = ? AND method = ?",
+                (path, method),
+            ).fetchone()
+        if row is not None and tuple(row[:3]) == key:
+            return row[3]
+        digest = hashes(path, [method], buffer_size)[method]
+        if self._stat_key(path) == key:
+            # Don't store the hash if the file changed while it was read
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, method) + key + (digest,),
+                )
+        return digest
+
+    def prune(self) -> int:
+        """
+        Remove the entries of files which were deleted or changed.
+
+        Returns
+        -------
+        nb_removed : int
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT path, size, mtime_ns, inode FROM hashes"
+            ).fetchall()
+        stale = []
+        for row in rows:
+            try:
+                if self._stat_key(row[0]) != tuple(row[1:]):
+                    stale.append(row)
+            except FileNotFoundError:
+                stale.append(row)
+        with self._lock, self._connection:
+            cursor = self._connection.executemany(
+                "DELETE FROM hashes "
+                "WHERE path = ? AND size = ? AND mtime_ns = ? AND inode = ?",
+                stale,
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "HashCache":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def _stat_key(path: str) -> Tuple[int, int, int]:
+        stat = os.stat(path)
+        return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def _get_hash_function(method: str) -> Any:
+    """Create a new hash object for the given method."""
+    if method in ["sha1", "md5", "sha256", "blake2b"]:
+        return hashlib.new(method)
+    elif method in ["xxh64", "xxh3_64", "xxh3_128"]:
+        # Third party
+        import xxhash
+
+        return getattr(xxhash, method)()
+    else:
+        raise NotImplementedError(
+            f"Only md5, sha1, sha256, blake2b, xxh64, xxh3_64 and xxh3_128 "
+            f"hashes are known, but '{method}' was specified."
+        )
 
 
 def get_creation_datetime(filepath: str) -> Optional[datetime]:
@@ -320,12 +1877,16 @@ def get_creation_datetime(filepath: str) -> Optional[datetime]:
     -------
     creation_datetime : Optional[datetime]
     """
+    return _get_creation_datetime(os.stat(filepath))
+
+
+def _get_creation_datetime(stat: os.stat_result) -> Optional[datetime]:
+    """See documentation of mpu.io.get_creation_datetime."""
     if platform.system() == "Windows":
-        return datetime.fromtimestamp(os.path.getctime(filepath))
+        return datetime.fromtimestamp(stat.st_ctime)
     else:
-        stat = os.stat(filepath)
         try:
-            return datetime.fromtimestamp(stat.st_birthtime)
+            return datetime.fromtimestamp(stat.st_birthtime)  # type: ignore
         except AttributeError:
             # We're probably on Linux. No easy way to get creation dates here,
             # so we'll settle for when its content was last modified.
@@ -385,38 +1946,354 @@ def get_file_meta(filepath: str) -> Dict[str, Any]:
     -------
     meta : dict
     """
+    # Third party
+    import tzlocal
+
+    return _get_file_meta(
+        filepath, tzlocal.get_localzone(), _get_magic_handles(threading.local())
+    )
+
+
+def get_files_meta(
+    filepaths: Iterable[str], max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get meta-information about many files.
+
+    In contrast to calling :func:`get_file_meta` for every file, every file
+    is stat'ed only once, the local timezone is determined only once and the
+    libmagic handles are re-used by each thread.
+
+    Parameters
+    ----------
+    filepaths : Iterable[str]
+    max_workers : Optional[int]
+        Number of threads. See concurrent.futures.ThreadPoolExecutor
+
+    Returns
+    -------
+    metas : List[Dict[str, Any]]
+        The meta-information of the files in the same order as filepaths.
+        See :func:`get_file_meta`.
+    """
+    # Core Library
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Third party
+    import tzlocal
+
+    timezone = tzlocal.get_localzone()
+    thread_data = threading.local()  # libmagic handles are not thread-safe
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda filepath: _get_file_meta(
+                    filepath, timezone, _get_magic_handles(thread_data)
+                ),
+                filepaths,
+            )
+        )
+
+
+def _get_magic_handles(thread_data: threading.local) -> Optional[Tuple[Any, Any]]:
+    """Get the (mime, magic-type) handles of this thread if magic is installed."""
+    if not hasattr(thread_data, "magic_handles"):
+        try:
+            # Third party
+            import magic
+
+            thread_data.magic_handles = (
+                magic.Magic(mime=True, uncompress=True),
+                magic.Magic(mime=False, uncompress=True),
+            )
+        except ImportError:
+            thread_data.magic_handles = None
+    return thread_data.magic_handles
+
+
+def _get_file_meta(
+    filepath: str, timezone: Any, magic_handles: Optional[Tuple[Any, Any]]
+) -> Dict[str, Any]:
+    """See documentation of mpu.io.get_file_meta."""
+    stat = os.stat(filepath)
     meta: Dict[str, Any] = {
         "filepath": os.path.abspath(filepath),
-        "creation_datetime": get_creation_datetime(filepath),
-        "last_access_datetime": get_access_datetime(filepath),
-        "modification_datetime": get_modification_datetime(filepath),
+        "creation_datetime": _get_creation_datetime(stat),
+        "last_access_datetime": datetime.fromtimestamp(stat.st_atime).replace(
+            tzinfo=timezone
+        ),
+        "modification_datetime": datetime.fromtimestamp(stat.st_mtime).replace(
+            tzinfo=timezone
+        ),
     }
-    try:
-        # Third party
-        import magic
-
-        f_mime = magic.Magic(mime=True, uncompress=True)
-        f_other = magic.Magic(mime=False, uncompress=True)
+    if magic_handles is not None:
+        f_mime, f_other = magic_handles
         meta["mime"] = f_mime.from_file(meta["filepath"])
         meta["magic-type"] = f_other.from_file(meta["filepath"])
-    except ImportError:
-        pass
     return meta
 
 
-def gzip_file(source: str, sink: str) -> None:
+def gzip_file(
+    source: str,
+    sink: str,
+    atomic: bool = False,
+    level: int = 9,
+    block_size: int = 1048576,
+    max_workers: Optional[int] = None,
+) -> None:
     """
     Create a GZIP file from a source file.
 
+    Like pigz, the source is split into blocks which are compressed in
+    parallel threads (zlib releases the GIL). Every block is written as its
+    own gzip member; a sequence of members is a valid gzip file which is
+    read by gzip.open, gunzip and :func:`gunzip_file`.
+
+    Parameters
+    ----------
+    source : str
+        Filepath
+    sink : str
+        Filepath
+    atomic : bool, optional (default: False)
+        Only replace sink once the compressed file is complete.
+        See :func:`write`.
+    level : int, optional (default: 9)
+        Compression level from 0 (no compression) to 9 (best compression)
+    block_size : int, optional (default: 1048576 byte = 1 MiB)
+        Bigger blocks compress slightly better, smaller blocks need less
+        memory.
+    max_workers : Optional[int]
+        Number of threads. Defaults to the number of CPUs.
+    """
+    # Core Library
+    import gzip
+    from concurrent.futures import ThreadPoolExecutor
+
+    if atomic:
+        with atomic_path(sink) as tmp_path:
+            gzip_file(source, tmp_path, False, level, block_size, max_workers)
+        return
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with open(source, "rb") as f_in, open(sink, "wb") as f_out, ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as executor:
+        # Bound the number of blocks in memory while keeping all threads busy
+        pending: Deque[Any] = collections.deque()
+        is_empty = True
+        for block in iter(lambda: f_in.read(block_size), b""):
+            is_empty = False
+            pending.append(executor.submit(gzip.compress, block, level))
+            if len(pending) >= 2 * max_workers:
+                f_out.write(pending.popleft().result())
+        while pending:
+            f_out.write(pending.popleft().result())
+        if is_empty:
+            f_out.write(gzip.compress(b"", level))
+
+
+def gunzip_file(source: str, sink: str, atomic: bool = False) -> None:
+    """
+    Decompress a GZIP file.
+
     Parameters
     ----------
     source : str
         Filepath
     sink : str
         Filepath
+    atomic : bool, optional (default: False)
+        Only replace sink once the decompressed file is complete.
+        See :func:`write`.
     """
     # Core Library
     import gzip
 
-    with open(source, "rb") as f_in, gzip.open(sink, "wb") as f_out:
-        f_out.writelines(f_in)
+    if atomic:
+        with atomic_path(sink) as tmp_path:
+            gunzip_file(source, tmp_path)
+        return
+
+    with gzip.open(source, "rb") as f_in, open(sink, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out, 1048576)
+
+
+def zstd_file(
+    source: str,
+    sink: str,
+    atomic: bool = False,
+    level: int = 3,
+    threads: int = -1,
+) -> None:
+    """
+    Create a Zstandard file from a source file.
+
+    This requires the zstandard package.
+
+    Parameters
+    ----------
+    source : str
+        Filepath
+    sink : str
+        Filepath
+    atomic : bool, optional (default: False)
+        Only replace sink once the compressed file is complete.
+        See :func:`write`.
+    level : int, optional (default: 3)
+        Compression level from 1 to 22
+    threads : int, optional (default: -1)
+        Number of compression threads. -1 uses one thread per CPU, 0 compresses
+        in the calling thread.
+    """
+    # Third party
+    import zstandard
+
+    if atomic:
+        with atomic_path(sink) as tmp_path:
+            zstd_file(source, tmp_path, False, level, threads)
+        return
+
+    compressor = zstandard.ZstdCompressor(level=level, threads=threads)
+    with open(source, "rb") as f_in, open(sink, "wb") as f_out:
+        compressor.copy_stream(f_in, f_out, size=os.path.getsize(source))
+
+
+def unzstd_file(source: str, sink: str, atomic: bool = False) -> None:
+    """
+    Decompress a Zstandard file.
+
+    This requires the zstandard package.
+
+    Parameters
+    ----------
+    source : str
+        Filepath
+    sink : str
+        Filepath
+    atomic : bool, optional (default: False)
+        Only replace sink once the decompressed file is complete.
+        See :func:`write`.
+    """
+    # Third party
+    import zstandard
+
+    if atomic:
+        with atomic_path(sink) as tmp_path:
+            unzstd_file(source, tmp_path)
+        return
+
+    decompressor = zstandard.ZstdDecompressor()
+    with open(source, "rb") as f_in, open(sink, "wb") as f_out:
+        decompressor.copy_stream(f_in, f_out)
+
+
+def _read_compressed(filepath: str, kwargs: Dict) -> Any:
+    """Decompress into a temporary file and read that file."""
+    decompress = unzstd_file if _is_zstd(_read_head(filepath)) else gunzip_file
+    with tempfile.TemporaryDirectory() as directory:
+        inner_path = os.path.join(directory, _strip_compression(filepath))
+        decompress(filepath, inner_path)
+        return read(inner_path, **kwargs)
+
+
+def _write_compressed(filepath: str, data: Any, kwargs: Dict) -> Any:
+    """Write data to a temporary file and compress it to filepath."""
+    compress = zstd_file if filepath.lower().endswith(".zst") else gzip_file
+    with tempfile.TemporaryDirectory() as directory:
+        inner_path = os.path.join(directory, _strip_compression(filepath))
+        write(inner_path, data, **kwargs)
+        compress(inner_path, filepath)
+    return data
+
+
+def _strip_compression(filepath: str) -> str:
+    """Get the basename of the uncompressed file."""
+    basename = os.path.basename(filepath)
+    root, extension = os.path.splitext(basename)
+    if extension.lower() in [".gz", ".zst"]:
+        return root
+    return basename
+
+
+def _read_head(filepath: str) -> bytes:
+    with open(filepath, "rb") as fp:
+        return fp.read(_SNIFF_SIZE)
+
+
+def _is_gzip(head: bytes) -> bool:
+    return head.startswith(b"\x1f\x8b")
+
+
+def _is_zstd(head: bytes) -> bool:
+    return head.startswith(b"\x28\xb5\x2f\xfd")
+
+
+def _is_pickle(head: bytes) -> bool:
+    # Protocol 2 and higher start with the PROTO opcode
+    return head.startswith(_OUT_OF_BAND_MAGIC) or (
+        len(head) > 1 and head[0] == 0x80 and 2 <= head[1] <= 5
+    )
+
+
+def _decode_head(head: bytes) -> Optional[str]:
+    """Decode the head of a text file. The last character may be cut off."""
+    try:
+        return head.decode("utf8")
+    except UnicodeDecodeError as error:
+        if error.start < len(head) - 3:
+            return None
+        return head[: error.start].decode("utf8")
+
+
+def _is_jsonl(head: bytes) -> bool:
+    """Check if the first two lines are complete JSON values."""
+    text = _decode_head(head)
+    if text is None:
+        return False
+    lines = [line for line in text.split("\n") if line.strip()]
+    if len(lines) < 2 or not lines[0].lstrip().startswith(("{", "[")):
+        return False
+    try:
+        json.loads(lines[0])
+        json.loads(lines[1])
+    except ValueError:
+        return False
+    return True
+
+
+def _is_json(head: bytes) -> bool:
+    text = _decode_head(head)
+    return text is not None and text.lstrip().startswith(("{", "["))
+
+
+def _is_csv(head: bytes) -> bool:
+    text = _decode_head(head)
+    return text is not None and "\x00" not in text
+
+
+register_format("csv", [".csv"], _read_csv, _write_csv, _is_csv, priority=-30)
+register_format("json", [".json"], _read_json, _write_json, _is_json, priority=-20)
+register_format("jsonl", [".jsonl"], _read_jsonl, _write_jsonl, _is_jsonl, priority=-10)
+register_format("pickle", [".pickle"], _read_pickle, _write_pickle, _is_pickle)
+register_format(
+    "parquet",
+    [".parquet"],
+    _read_parquet,
+    _write_parquet,
+    lambda head: head.startswith(b"PAR1"),
+)
+register_format(
+    "feather",
+    [".feather", ".arrow"],
+    _read_feather,
+    _write_feather,
+    lambda head: head.startswith(b"ARROW1"),
+)
+register_format(
+    "gzip", [".gz"], _read_compressed, _write_compressed, _is_gzip, priority=10
+)
+register_format(
+    "zstd", [".zst"], _read_compressed, _write_compressed, _is_zstd, priority=10
+)
@@ -10,18 +10,52 @@ Standard libraries are:
 """
 
 # Core Library
+import heapq
 import math as math_stl
 import operator
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from functools import reduce
-from typing import Dict, Iterable, Iterator, List, Optional
+from itertools import chain, compress, count, islice
+from typing import Any, Callable
+from typing import Counter as Counter_t
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
+
+if sys.version_info >= (3, 8):
+    # Core Library
+    from typing import Literal
+else:
+    # Third party
+    from typing_extensions import Literal  # necessary until 3.8
+
+# Number of integers per segment of the sieve. The bytearray of a segment
+# should fit into the CPU cache.
+_SEGMENT_SIZE = 262144
+
+_PRIME_TABLE_MAGIC = b"MPUPRIME"
 
 
 def generate_primes() -> Iterator[int]:
     """
     Generate an infinite sequence of prime numbers.
 
-    The algorithm was originally written by David Eppstein, UC Irvine. See:
-    http://code.activestate.com/recipes/117119/
+    The primes are taken from the shared :class:`PrimeTable`, which is
+    extended on demand. Beyond its maximal limit, the primes are computed
+    block-wise with a segmented Sieve of Eratosthenes, see
+    :func:`primes_in_range`.
 
     Examples
     --------
@@ -33,41 +67,308 @@ def generate_primes() -> Iterator[int]:
     >>> next(g)
     5
     """
-    divisors: Dict[int, List[int]] = {}  # map number to at least one divisor
+    index = 0
+    while True:
+        if index == len(prime_table):
+            if prime_table.limit >= prime_table.max_limit:
+                break
+            prime_table.extend(2 * prime_table.limit)
+        yield prime_table[index]
+        index += 1
+
+    low = prime_table.limit + 1
+    segment_size = _SEGMENT_SIZE
+    base_primes: List[int] = []
+    while True:
+        high = low + segment_size
+        if not base_primes or base_primes[-1] ** 2 < high:
+            base_primes = primes_up_to(2 * _isqrt(high) + 1)
+        yield from _sieve_segment(low, high, base_primes)
+        low = high
+
+
+def primes_up_to(n: int) -> List[int]:
+    """
+    Get all prime numbers which are smaller or equal to n.
+
+    Parameters
+    ----------
+    n : int
+
+    Returns
+    -------
+    primes : List[int]
+
+    Examples
+    --------
+    >>> primes_up_to(20)
+    [2, 3, 5, 7, 11, 13, 17, 19]
+    >>> primes_up_to(1)
+    []
+    """
+    if n < 2:
+        return []
+    if n <= prime_table.max_limit:
+        return prime_table.primes_up_to(n)
+    return primes_in_range(0, n + 1)
+
+
+def _sieve_table(n: int) -> bytearray:
+    """Get a bytearray t of length n + 1 with t[i] == 1 iff i is prime."""
+    sieve = bytearray([1]) * (n + 1)
+    sieve[: min(2, n + 1)] = bytes(min(2, n + 1))
+    for p in range(2, _isqrt(n) + 1):
+        if sieve[p]:
+            sieve[p * p :: p] = bytes(len(range(p * p, n + 1, p)))
+    return sieve
+
+
+def primes_in_range(a: int, b: int) -> List[int]:
+    """
+    Get all prime numbers p with a <= p < b.
+
+    This is a segmented Sieve of Eratosthenes: The range is sieved in
+    segments which fit into the CPU cache, using only the primes up to
+    sqrt(b).
+
+    Parameters
+    ----------
+    a : int
+    b : int
+
+    Returns
+    -------
+    primes : List[int]
+
+    Examples
+    --------
+    >>> primes_in_range(10, 30)
+    [11, 13, 17, 19, 23, 29]
+    >>> primes_in_range(10**12, 10**12 + 100)
+    [1000000000039, 1000000000061, 1000000000063, 1000000000091]
+    """
+    a = max(a, 0)
+    if b <= a:
+        return []
+    base_primes = primes_up_to(_isqrt(b - 1))
+    primes: List[int] = []
+    for low in range(a, b, _SEGMENT_SIZE):
+        primes.extend(_sieve_segment(low, min(low + _SEGMENT_SIZE, b), base_primes))
+    return primes
+
 
-    candidate = 2  # next potential prime
+def _sieve_segment(low: int, high: int, base_primes: List[int]) -> Iterator[int]:
+    """Get the primes in [low, high). base_primes must reach sqrt(high)."""
+    sieve = bytearray([1]) * (high - low)
+    for p in base_primes:
+        if p * p >= high:
+            break
+        start = max(p * p, -(-low // p) * p)
+        sieve[start - low :: p] = bytes(len(range(start, high, p)))
+    for number in range(low, min(2, high)):
+        sieve[number - low] = 0
+    return compress(range(low, high), sieve)
 
+
+def _isqrt(n: int) -> int:
+    """
+    Get the biggest integer r with r*r <= n.
+
+    math.isqrt is only available since Python 3.8.
+
+    Examples
+    --------
+    >>> _isqrt(24), _isqrt(25), _isqrt(10**40)
+    (4, 5, 100000000000000000000)
+    """
+    if n < 0:
+        raise ValueError(f"Square root of negative number {n}")
+    if n == 0:
+        return 0
+    x = 1 << ((n.bit_length() + 1) // 2)
     while True:
-        if candidate in divisors:
-            # candidate is composite. divisors[candidate] is the list of primes
-            # that divide it. Since we've reached candidate, we no longer need
-            # it in the map, but we'll mark the next multiples of its witnesses
-            # to prepare for larger numbers
-            for p in divisors[candidate]:
-                divisors.setdefault(p + candidate, []).append(p)
-            del divisors[candidate]
-        else:
-            # candidate is a new prime
-            yield candidate
+        y = (x + n // x) // 2
+        if y >= x:
+            return x
+        x = y
+
+
+class PrimeTable:
+    """
+    A thread-safe table of all primes up to a limit, grown on demand.
+
+    The primes are stored compactly as unsigned 64-bit integers. The table
+    :data:`prime_table` is shared by :func:`generate_primes`,
+    :func:`primes_up_to`, :func:`is_prime` and :func:`factorize`. It can be
+    saved to disk, so that a restarted process does not sieve again.
+
+    Parameters
+    ----------
+    max_limit : int, optional (default: 100 000 000)
+        The table does not grow beyond this limit. At the default limit it
+        holds 5 761 455 primes (46 MB).
+
+    Examples
+    --------
+    >>> table = PrimeTable()
+    >>> table.extend(30)
+    >>> table.primes_up_to(30)
+    [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    >>> 29 in table, 27 in table
+    (True, False)
+    """
+
+    def __init__(self, max_limit: int = 10**8) -> None:
+        self.max_limit = max_limit
+        self._primes = array("Q", [2, 3, 5, 7])
+        self._limit = 10
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """All primes up to this limit are in the table."""
+        return self._limit
+
+    def __len__(self) -> int:
+        return len(self._primes)
+
+    def __getitem__(self, index: int) -> int:
+        return self._primes[index]
+
+    def __contains__(self, number: int) -> bool:
+        index = bisect_left(self._primes, number)
+        return index < len(self._primes) and self._primes[index] == number
+
+    def extend(self, n: int) -> None:
+        """
+        Add all primes up to n to the table, but not beyond max_limit.
+
+        The table grows at least by a factor of two, so that many small
+        extensions do not sieve many small segments.
+        """
+        if n <= self._limit:
+            return
+        with self._lock:
+            if n <= self._limit:
+                return
+            new_limit = min(max(n, 2 * self._limit), self.max_limit)
+            base_primes = list(compress(count(), _sieve_table(_isqrt(new_limit))))
+            for low in range(self._limit + 1, new_limit + 1, _SEGMENT_SIZE):
+                high = min(low + _SEGMENT_SIZE, new_limit + 1)
+                self._primes.extend(_sieve_segment(low, high, base_primes))
+            # Readers rely on the primes being stored before the limit grows
+            self._limit = new_limit
 
-            # mark its first multiple that isn't
-            # already marked in previous iterations
-            divisors[candidate * candidate] = [candidate]
+    def primes_up_to(self, n: int) -> List[int]:
+        """Get all primes p <= n. n must not be bigger than max_limit."""
+        if n > self.max_limit:
+            raise ValueError(f"n={n} is bigger than max_limit={self.max_limit}")
+        self.extend(n)
+        return self._primes[: bisect_right(self._primes, n)].tolist()
 
-        candidate += 1
+    def save(self, path: str) -> None:
+        """
+        Store the table in a file.
 
+        The file consists of a magic header, the limit and the number of
+        primes as little-endian unsigned 64-bit integers, followed by the
+        primes in the same format.
+        """
+        with self._lock:
+            limit = self._limit
+            primes = array("Q", self._primes)
+        # First party
+        from mpu.io import atomic_path
 
-def factorize(number: int) -> List[int]:
+        if sys.byteorder == "big":
+            primes.byteswap()
+        with atomic_path(path) as tmp_path, open(tmp_path, "wb") as handle:
+            handle.write(_PRIME_TABLE_MAGIC)
+            handle.write(struct.pack("<QQ", limit, len(primes)))
+            handle.write(primes.tobytes())
+
+    def load(self, path: str) -> None:
+        """
+        Add the primes of a file written by :meth:`save` to the table.
+
+        Primes beyond max_limit are ignored.
+        """
+        with open(path, "rb") as handle:
+            magic = handle.read(len(_PRIME_TABLE_MAGIC))
+            header = handle.read(16)
+            if magic != _PRIME_TABLE_MAGIC or len(header) != 16:
+                raise ValueError(f"{path} is not a prime table")
+            limit, length = struct.unpack("<QQ", header)
+            primes = array("Q")
+            primes.frombytes(handle.read(8 * length))
+        if len(primes) != length:
+            raise ValueError(f"{path} is truncated")
+        if sys.byteorder == "big":
+            primes.byteswap()
+        if limit > self.max_limit:
+            limit = self.max_limit
+            del primes[bisect_right(primes, limit) :]
+        with self._lock:
+            if limit > self._limit:
+                self._primes = primes
+                self._limit = limit
+
+
+prime_table = PrimeTable()
+
+
+# Trial division by these primes precedes the Miller-Rabin test
+_SMALL_PRIMES_BOUND = 1000
+_SMALL_PRIMES = tuple(primes_up_to(_SMALL_PRIMES_BOUND))
+
+# The first 13 primes are a deterministic set of Miller-Rabin bases for all
+# numbers below this bound (Sorenson and Webster, 2015)
+_MILLER_RABIN_BOUND = 3317044064679887385961981
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# are_prime sieves up to the biggest number if it is at most this limit
+_ARE_PRIME_SIEVE_LIMIT = 10**7
+
+# factorize_many uses a lookup table of at most this size (4 bytes per entry)
+_SPF_MAX_TABLE_SIZE = 2 * 10**7
+
+
+@overload
+def factorize(number: int, as_counter: Literal[False] = ...) -> List[int]:
+    ...
+
+
+@overload
+def factorize(number: int, as_counter: Literal[True]) -> Counter_t[int]:
+    ...
+
+
+@overload
+def factorize(number: int, as_counter: bool) -> Union[List[int], Counter_t[int]]:
+    ...
+
+
+def factorize(
+    number: int, as_counter: bool = False
+) -> Union[List[int], Counter_t[int]]:
     """
     Get the prime factors of an integer except for 1.
 
+    Small prime factors are found by trial division, the remaining big ones
+    with Pollard-Brent rho. Hence also products of two 10-digit primes are
+    factorized quickly.
+
     Parameters
     ----------
     number : int
+    as_counter : bool, optional (default: False)
+        Return a Counter which maps each prime to its exponent instead of
+        the list of factors
 
     Returns
     -------
-    primes : List[int]
+    primes : Union[List[int], Counter[int]]
+        The factors in ascending order
 
     Examples
     --------
@@ -79,34 +380,205 @@ def factorize(number: int) -> List[int]:
     [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3]
     >>> factorize(1)
     [1]
+    >>> factorize(1000000000039 * 1000000000061)
+    [1000000000039, 1000000000061]
+    >>> factorize(360, as_counter=True)
+    Counter({2: 3, 3: 2, 5: 1})
     """
     if not isinstance(number, int):
         raise ValueError(f"integer expected, but type(number)={type(number)}")
     if number < 0:
-        return [-1] + factorize(number * (-1))
+        factors = [-1] + _factorize_positive(-number)
     elif number == 0:
         raise ValueError("All primes are prime factors of 0.")
     else:
-        factors = []
-        factor = 2
-        while number % factor == 0:
-            factors.append(factor)
-            number = number // factor
-        if number == 1:
-            if len(factors) > 0:
-                return factors
-            else:
-                return [1]
-        for factor in range(3, int(math_stl.ceil(number**0.5)) + 1, 2):
-            if number % factor == 0:
-                return factors + [factor] + factorize(number // factor)
-        return factors + [number]
+        factors = _factorize_positive(number)
+    if as_counter:
+        return Counter(factors)
+    return factors
+
+
+def factorize_many(
+    numbers: Iterable[int], max_table_size: int = _SPF_MAX_TABLE_SIZE
+) -> List[List[int]]:
+    """
+    Get the prime factors of many integers, see :func:`factorize`.
+
+    A table of the smallest prime factor of each number up to the biggest
+    input is built once and cached, so each number below the table size is
+    factorized with a few table lookups. Bigger numbers are factorized with
+    :func:`factorize`. This requires NumPy.
+
+    Parameters
+    ----------
+    numbers : Iterable[int]
+    max_table_size : int, optional (default: 20 000 000)
+        The table needs 4 bytes per entry and is not grown beyond this size
+
+    Returns
+    -------
+    factors : List[List[int]]
+
+    Examples
+    --------
+    >>> factorize_many([12, -17, 1, 2**61 - 1])
+    [[2, 2, 3], [-1, 17], [1], [2305843009213693951]]
+    """
+    values = [_as_integer(number) for number in numbers]
+    if 0 in values:
+        raise ValueError("All primes are prime factors of 0.")
+    small = [abs(value) for value in values if abs(value) <= max_table_size]
+    small_factors = iter(_factorize_with_table(small, max_table_size) if small else [])
+    result: List[List[int]] = []
+    for value in values:
+        if abs(value) > max_table_size:
+            result.append(factorize(value))
+            continue
+        factors = next(small_factors) or [1]
+        result.append([-1] + factors if value < 0 else factors)
+    return result
+
+
+def _as_integer(number: Any) -> int:
+    try:
+        return operator.index(number)
+    except TypeError:
+        raise ValueError(
+            f"integer expected, but type(number)={type(number)}"
+        ) from None
+
+
+def _factorize_with_table(numbers: List[int], max_table_size: int) -> List[List[int]]:
+    """Get the prime factors of positive numbers with the lookup table."""
+    # Third party
+    import numpy as np
+
+    table = _get_spf_table(max(numbers), max_table_size)
+    result: List[List[int]] = []
+    chunk_size = 65536  # bounds the memory of the factor matrix
+    for start in range(0, len(numbers), chunk_size):
+        remaining = np.array(numbers[start : start + chunk_size], dtype=np.int64)
+        columns = []
+        while True:
+            is_composite = remaining > 1
+            if not is_composite.any():
+                break
+            factors = np.where(is_composite, table[remaining], 0)
+            columns.append(factors)
+            remaining //= np.where(is_composite, factors, 1)
+        if not columns:
+            result += [[] for _ in remaining]
+            continue
+        matrix = np.stack(columns, axis=1)
+        counts = np.count_nonzero(matrix, axis=1).tolist()
+        result += [row[:count] for row, count in zip(matrix.tolist(), counts)]
+    return result
+
+
+_spf_table = None
+
+
+def _get_spf_table(n: int, max_table_size: int) -> Any:
+    """
+    Get an array t of length > n with the smallest prime factor t[i] of i.
+
+    The table is cached. When a bigger one is needed, it is rebuilt with
+    twice the size, but not beyond max_table_size.
+    """
+    # Third party
+    import numpy as np
+
+    global _spf_table
+    if _spf_table is not None and len(_spf_table) > n:
+        return _spf_table
+    if _spf_table is not None:
+        n = max(n, min(2 * len(_spf_table), max_table_size))
+    table = np.zeros(n + 1, dtype=np.uint32)
+    for prime in primes_up_to(_isqrt(n)):
+        multiples = table[prime * prime :: prime]
+        multiples[multiples == 0] = prime
+    unmarked = np.flatnonzero(table == 0)
+    table[unmarked] = unmarked
+    _spf_table = table
+    return table
+
+
+def _factorize_positive(number: int) -> List[int]:
+    """Get the sorted prime factors of a positive integer."""
+    factors: List[int] = []
+    for prime in _SMALL_PRIMES:
+        if prime * prime > number:
+            break
+        while number % prime == 0:
+            factors.append(prime)
+            number //= prime
+    if number >= _SMALL_PRIMES_BOUND**2:
+        # No prime factor is below _SMALL_PRIMES_BOUND
+        factors += sorted(_factorize_rough(number))
+    elif number > 1 or not factors:
+        factors.append(number)
+    return factors
+
+
+def _factorize_rough(number: int) -> List[int]:
+    """Get the prime factors of a number without small prime factors."""
+    factors = []
+    composites = [number]
+    while composites:
+        number = composites.pop()
+        if is_prime(number):
+            factors.append(number)
+        else:
+            divisor = _pollard_brent(number)
+            composites += [divisor, number // divisor]
+    return factors
+
+
+def _pollard_brent(number: int) -> int:
+    """Find a non-trivial divisor of an odd composite number."""
+    for c in count(1):
+        divisor = _pollard_brent_cycle(number, c)
+        if divisor != number:
+            return divisor
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def _pollard_brent_cycle(number: int, c: int) -> int:
+    """Search a divisor with Brent's cycle detection on x -> x**2 + c."""
+    batch_size = 128
+    y, x, ys = 2, 2, 2
+    divisor, power, q = 1, 1, 1
+    while divisor == 1:
+        x = y
+        for _ in range(power):
+            y = (y * y + c) % number
+        k = 0
+        while k < power and divisor == 1:
+            ys = y
+            for _ in range(min(batch_size, power - k)):
+                y = (y * y + c) % number
+                q = q * abs(x - y) % number
+            divisor = math_stl.gcd(q, number)
+            k += batch_size
+        power *= 2
+    if divisor == number:
+        # The batched product skipped over the divisor, so step back
+        divisor = 1
+        while divisor == 1:
+            ys = (ys * ys + c) % number
+            divisor = math_stl.gcd(abs(x - ys), number)
+    return divisor
 
 
 def is_prime(number: int) -> bool:
     """
     Check if a number is prime.
 
+    Small factors are found by trial division. Numbers below 3.3 * 10**24
+    are checked with a deterministic set of Miller-Rabin bases, so the result
+    is exact for all 64-bit integers. Bigger numbers are checked with the
+    Baillie-PSW test, for which no counterexample is known.
+
     Parameters
     ----------
     number : int
@@ -123,18 +595,170 @@ def is_prime(number: int) -> bool:
     True
     >>> is_prime(47055833459)
     True
+    >>> is_prime(2**61 - 1)
+    True
+    >>> is_prime(2**64 + 1)
+    False
+    """
+    if not isinstance(number, int):
+        raise ValueError(f"integer expected, but type(number)={type(number)}")
+    if number < 2:
+        return False
+    if number <= prime_table.limit:
+        return number in prime_table
+    for prime in _SMALL_PRIMES:
+        if number % prime == 0:
+            return number == prime
+    if number < _SMALL_PRIMES_BOUND**2:
+        return True
+    if number < _MILLER_RABIN_BOUND:
+        return all(
+            _is_strong_probable_prime(number, base) for base in _MILLER_RABIN_BASES
+        )
+    return _is_strong_probable_prime(number, 2) and _is_strong_lucas_probable_prime(
+        number
+    )
+
+
+def are_prime(numbers: Iterable[int]) -> Any:
+    """
+    Check for each of the numbers if it is prime.
+
+    If all numbers are small, a single sieve up to the biggest number is used
+    instead of checking each number on its own.
+
+    Parameters
+    ----------
+    numbers : Iterable[int]
+        A NumPy integer array or any iterable of integers
+
+    Returns
+    -------
+    are_prime_numbers : Union[List[bool], numpy.ndarray]
+        A boolean array of the same shape if numbers is a NumPy array,
+        otherwise a list
+
+    Examples
+    --------
+    >>> are_prime([0, 1, 2, 3, 4, 5, -5, 2**61 - 1])
+    [False, False, True, True, False, True, False, True]
     """
-    return len(factorize(number)) == 1
+    if _is_numpy_array(numbers):
+        return _are_prime_array(numbers)
+    values = list(numbers)
+    if values and all(isinstance(value, int) for value in values):
+        biggest = max(values)
+        if biggest <= _ARE_PRIME_SIEVE_LIMIT:
+            table = _sieve_table(max(biggest, 1))
+            return [value >= 0 and table[value] == 1 for value in values]
+    return [is_prime(value) for value in values]
+
+
+def _are_prime_array(numbers: Any) -> Any:
+    # Third party
+    import numpy as np
+
+    numbers = np.asarray(numbers)
+    if numbers.dtype.kind not in "iu":
+        raise ValueError(f"integer array expected, but dtype={numbers.dtype}")
+    if numbers.size == 0:
+        return np.zeros(numbers.shape, dtype=bool)
+    biggest = int(numbers.max())
+    if biggest > _ARE_PRIME_SIEVE_LIMIT:
+        return np.fromiter(
+            (is_prime(int(value)) for value in numbers.flat),
+            dtype=bool,
+            count=numbers.size,
+        ).reshape(numbers.shape)
+    table = np.frombuffer(_sieve_table(max(biggest, 1)), dtype=np.uint8).view(bool)
+    result = np.zeros(numbers.shape, dtype=bool)
+    non_negative = numbers >= 0
+    result[non_negative] = table[numbers[non_negative]]
+    return result
+
+
+def _is_strong_probable_prime(n: int, base: int) -> bool:
+    """Miller-Rabin test of the odd number n > base to the given base."""
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _is_strong_lucas_probable_prime(n: int) -> bool:
+    """Strong Lucas test of the odd number n with Selfridge's parameters."""
+    if _isqrt(n) ** 2 == n:
+        return False
+    d = 5
+    while _jacobi(d, n) != -1:
+        d = -d - 2 if d > 0 else -d + 2
+    p, q = 1, (1 - d) // 4
+
+    k = n + 1
+    s = 0
+    while k % 2 == 0:
+        k //= 2
+        s += 1
 
+    # Compute U_k, V_k and Q^k modulo n, going through the bits of k
+    u, v, q_k = 1, p, q % n
+    for bit in bin(k)[3:]:
+        u = u * v % n
+        v = (v * v - 2 * q_k) % n
+        q_k = q_k * q_k % n
+        if bit == "1":
+            u, v = p * u + v, d * u + p * v
+            u = (u + n if u % 2 else u) // 2 % n
+            v = (v + n if v % 2 else v) // 2 % n
+            q_k = q_k * q % n
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * q_k) % n
+        q_k = q_k * q_k % n
+        if v == 0:
+            return True
+    return False
 
-def product(iterable: Iterable, start: int = 1) -> int:
+
+def _jacobi(a: int, n: int) -> int:
+    """Get the Jacobi symbol (a/n) for an odd positive n."""
+    a %= n
+    result = 1
+    while a != 0:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def product(iterable: Iterable, start: int = 1) -> Any:
     """
     Calculate the product of the iterables.
 
+    For NumPy arrays the product is computed by NumPy. Integer arrays are
+    only multiplied with fixed-width integers if the sum of the logarithms
+    shows that the result fits into 64 bits, otherwise with Python integers.
+    Hence the result is exact.
+
     Parameters
     ----------
     iterable : iterable
-        List, tuple or similar which contains numbers
+        List, tuple, NumPy array or similar which contains numbers
     start : number, optional (default: 1)
 
     Returns
@@ -147,21 +771,44 @@ def product(iterable: Iterable, start: int = 1) -> int:
     120
     >>> product([])
     1
+    >>> import numpy as np
+    >>> product(np.arange(1, 26))
+    15511210043330985984000000
     """
+    if _is_numpy_array(iterable):
+        return _product_array(iterable, start)
     return reduce(operator.mul, iterable, start)
 
 
-def argmax(iterable: Iterable) -> Optional[int]:
+def _product_array(array: Any, start: Any) -> Any:
+    # Third party
+    import numpy as np
+
+    if array.dtype.kind not in "biu":
+        return np.prod(array) * start
+    if not array.all():
+        return 0 * start
+    bits = np.log2(np.abs(array.astype(np.float64))).sum()
+    if bits < 62:
+        return int(np.prod(array, dtype=np.int64)) * start
+    return reduce(operator.mul, array.ravel().tolist(), start)
+
+
+def argmax(iterable: Iterable, k: Optional[int] = None) -> Any:
     """
     Find the first index of the biggest value in the iterable.
 
     Parameters
     ----------
     iterable : Iterable
+        For NumPy arrays, indices into the flattened array are returned
+    k : Optional[int], optional (default: None)
+        Return the indices of the k biggest values instead of a single
+        index. They are ordered by value, equal values by index.
 
     Returns
     -------
-    argmax : Optional[int]
+    argmax : Union[Optional[int], List[int]]
 
     Examples
     --------
@@ -172,7 +819,13 @@ def argmax(iterable: Iterable) -> Optional[int]:
     >>> argmax([0, 1, 0])
     1
     >>> argmax([])
+    >>> argmax([3, 1, 4, 1, 5, 9, 2, 6], k=3)
+    [5, 7, 4]
     """
+    if _is_numpy_array(iterable):
+        return _argmax_array(iterable, k)
+    if k is not None:
+        return [index for index, _ in top_k(iterable, k)]
     max_value = None
     max_index = None
     for index, value in enumerate(iterable):
@@ -182,18 +835,127 @@ def argmax(iterable: Iterable) -> Optional[int]:
     return max_index
 
 
-def round_up(x: float, decimal_places: int) -> float:
+def top_k(
+    iterable: Iterable, k: int, key: Optional[Callable] = None, start: int = 0
+) -> List[Tuple[int, Any]]:
+    """
+    Find the k biggest values of a stream together with their indices.
+
+    Only a heap of the k best values is kept, so the memory is O(k). As in
+    :func:`argmax`, the first occurrence wins if values are equal.
+
+    Parameters
+    ----------
+    iterable : Iterable
+    k : int
+    key : Optional[Callable], optional (default: None)
+        Compare key(value) instead of the values
+    start : int, optional (default: 0)
+        Index of the first value. Workers which process a part of the stream
+        use this, so that their results can be combined with
+        :func:`merge_top_k`.
+
+    Returns
+    -------
+    top : List[Tuple[int, Any]]
+        (index, value) pairs, the best first
+
+    Examples
+    --------
+    >>> top_k([3, 1, 4, 1, 5, 9, 2, 6], 3)
+    [(5, 9), (7, 6), (4, 5)]
+    >>> top_k(["a", "bb", "cc", "d"], 2, key=len)
+    [(1, 'bb'), (2, 'cc')]
+    """
+    if k <= 0:
+        return []
+    items = enumerate(iterable, start)
+    heap = [
+        (value if key is None else key(value), -index, value)
+        for index, value in islice(items, k)
+    ]
+    heapq.heapify(heap)
+    if len(heap) == k:
+        threshold = heap[0][0]
+        for index, value in items:
+            score = value if key is None else key(value)
+            # Equal scores do not replace the root, which came first
+            if score > threshold:
+                heapq.heapreplace(heap, (score, -index, value))
+                threshold = heap[0][0]
+    return [(-negative_index, value) for _, negative_index, value in sorted(heap)[::-1]]
+
+
+def merge_top_k(
+    partial_results: Iterable[List[Tuple[int, Any]]],
+    k: int,
+    key: Optional[Callable] = None,
+) -> List[Tuple[int, Any]]:
+    """
+    Combine the results of :func:`top_k` for parts of a stream.
+
+    Parameters
+    ----------
+    partial_results : Iterable[List[Tuple[int, Any]]]
+    k : int
+    key : Optional[Callable], optional (default: None)
+        Must be the same as for top_k
+
+    Returns
+    -------
+    top : List[Tuple[int, Any]]
+        (index, value) pairs, the best first
+
+    Examples
+    --------
+    >>> first = top_k([3, 1, 4, 1], 3)
+    >>> second = top_k([5, 9, 2, 6], 3, start=4)
+    >>> merge_top_k([first, second], 3)
+    [(5, 9), (7, 6), (4, 5)]
+    """
+
+    def sort_key(pair: Tuple[int, Any]) -> Tuple[Any, int]:
+        index, value = pair
+        return (value if key is None else key(value), -index)
+
+    return heapq.nlargest(k, chain.from_iterable(partial_results), sort_key)
+
+
+def _argmax_array(array: Any, k: Optional[int]) -> Any:
+    # Third party
+    import numpy as np
+
+    values = array.ravel()
+    if k is None:
+        return int(np.argmax(values)) if values.size else None
+    k = min(k, values.size)
+    if k <= 0:
+        return []
+    # Partial sort: everything above the k-th biggest value is in the top k,
+    # values equal to it are taken by index
+    threshold = np.partition(values, values.size - k)[values.size - k]
+    above = np.flatnonzero(values > threshold)
+    equal = np.flatnonzero(values == threshold)[: k - len(above)]
+    candidates = np.concatenate([above, equal])[::-1]
+    order = np.argsort(values[candidates], kind="stable")[::-1]
+    return candidates[order].tolist()
+
+
+def round_up(x: Any, decimal_places: int) -> Any:
     """
     Round a float up to decimal_places.
 
+    Arrays are rounded by NumPy, which may round the last digit differently
+    than Python if the shifted value is exactly halfway between two results.
+
     Parameters
     ----------
-    x : float
+    x : float or numpy.ndarray
     decimal_places : int
 
     Returns
     -------
-    rounded_float : float
+    rounded_float : float or numpy.ndarray
 
     Examples
     --------
@@ -205,22 +967,28 @@ def round_up(x: float, decimal_places: int) -> float:
     1.235
     >>> round_up(1.23456, 2)
     1.24
+    >>> import numpy as np
+    >>> round_up(np.array([1.2344, 1.234]), 3)
+    array([1.235, 1.234])
     """
-    return round(x + 5 * 10 ** (-1 * (decimal_places + 1)), decimal_places)
+    shifted = x + 5 * 10 ** (-1 * (decimal_places + 1))
+    if _is_numpy_array(x):
+        return shifted.round(decimal_places)
+    return round(shifted, decimal_places)
 
 
-def round_down(x: float, decimal_places: int) -> float:
+def round_down(x: Any, decimal_places: int) -> Any:
     """
     Round a float down to decimal_places.
 
     Parameters
     ----------
-    x : float
+    x : float or numpy.ndarray
     decimal_places : int
 
     Returns
     -------
-    rounded_float : float
+    rounded_float : float or numpy.ndarray
 
     Examples
     --------
@@ -228,16 +996,29 @@ def round_down(x: float, decimal_places: int) -> float:
     1.234
     >>> round_down(1.23456, 2)
     1.23
+    >>> import numpy as np
+    >>> round_down(np.array([1.23456, -1.23456]), 2)
+    array([ 1.23, -1.24])
     """
-    d = int("1" + ("0" * decimal_places))
+    d = 10**decimal_places
+    if _is_numpy_array(x):
+        # Third party
+        import numpy as np
+
+        return np.floor(x * d) / d
     return math_stl.floor(x * d) / d
 
 
+def _is_numpy_array(obj: Any) -> bool:
+    return type(obj).__module__ == "numpy" and type(obj).__name__ == "ndarray"
+
+
 def gcd(a: int, b: int) -> int:
     """
     Calculate the greatest common divisor.
 
-    Currently, this uses the Euclidean algorithm.
+    Integers are handled by math.gcd, which uses a binary GCD in C. Other
+    numbers fall back to the Euclidean algorithm.
 
     Parameters
     ----------
@@ -267,6 +1048,163 @@ def gcd(a: int, b: int) -> int:
     """
     if a == 0 or b == 0:
         raise ValueError(f"gcd(a={a}, b={b}) is undefined")
+    if isinstance(a, int) and isinstance(b, int):
+        return math_stl.gcd(a, b)
     while b != 0:
         a, b = b, a % b
     return abs(a)
+
+
+def gcd_reduce(iterable: Iterable[int]) -> int:
+    """
+    Calculate the greatest common divisor of all numbers.
+
+    In contrast to :func:`gcd`, zeros are allowed: gcd(0, a) is abs(a) and
+    the gcd of no numbers is 0. NumPy integer arrays are reduced with
+    numpy.gcd, other iterables with math.gcd.
+
+    Parameters
+    ----------
+    iterable : Iterable[int]
+
+    Returns
+    -------
+    greatest_common_divisor : int
+
+    Examples
+    --------
+    >>> gcd_reduce([12, -18, 30])
+    6
+    >>> gcd_reduce([0, 0])
+    0
+    >>> gcd_reduce([])
+    0
+    """
+    if _is_numpy_array(iterable):
+        # Third party
+        import numpy as np
+
+        array = cast(np.ndarray, iterable)
+        if array.dtype.kind in "iu":
+            return int(np.gcd.reduce(array, axis=None)) if array.size else 0
+        iterable = array.ravel().tolist()
+    result = 0
+    for number in iterable:
+        result = math_stl.gcd(result, number)
+        if result == 1:
+            break
+    return result
+
+
+def gcd_many(a: Iterable[int], b: Iterable[int]) -> Any:
+    """
+    Calculate the element-wise greatest common divisor of a and b.
+
+    Zeros are allowed as in :func:`gcd_reduce`.
+
+    Parameters
+    ----------
+    a : Iterable[int]
+    b : Iterable[int]
+        If a or b is a NumPy array, the result is one as well. Arrays with a
+        fixed-width integer type use numpy.gcd, other arrays (e.g. of dtype
+        object for big integers) math.gcd.
+
+    Returns
+    -------
+    greatest_common_divisors : Union[List[int], numpy.ndarray]
+
+    Examples
+    --------
+    >>> gcd_many([12, 7, 0], [18, 5, -4])
+    [6, 1, 4]
+    """
+    return _elementwise(a, b, "gcd", math_stl.gcd)
+
+
+def lcm_reduce(iterable: Iterable[int]) -> int:
+    """
+    Calculate the least common multiple of all numbers.
+
+    The lcm of no numbers is 1 and the lcm of numbers with a zero is 0. The
+    result is computed with Python integers, so it does not overflow.
+
+    Parameters
+    ----------
+    iterable : Iterable[int]
+
+    Returns
+    -------
+    least_common_multiple : int
+
+    Examples
+    --------
+    >>> lcm_reduce([4, 6, -10])
+    60
+    >>> lcm_reduce([])
+    1
+    """
+    if _is_numpy_array(iterable):
+        # Third party
+        import numpy as np
+
+        iterable = np.unique(np.abs(cast(np.ndarray, iterable))).tolist()
+    return reduce(_lcm, iterable, 1)
+
+
+def lcm_many(a: Iterable[int], b: Iterable[int]) -> Any:
+    """
+    Calculate the element-wise least common multiple of a and b.
+
+    Parameters
+    ----------
+    a : Iterable[int]
+    b : Iterable[int]
+        If a or b is a NumPy array, the result is one as well. For arrays
+        with a fixed-width integer type numpy.lcm is used, unless a result
+        would overflow. Then the result is an array of dtype object.
+
+    Returns
+    -------
+    least_common_multiples : Union[List[int], numpy.ndarray]
+
+    Examples
+    --------
+    >>> lcm_many([4, 7, 0], [6, 5, 3])
+    [12, 35, 0]
+    """
+    return _elementwise(a, b, "lcm", _lcm)
+
+
+def _lcm(a: int, b: int) -> int:
+    if a == 0 or b == 0:
+        return 0
+    return abs(a // math_stl.gcd(a, b) * b)
+
+
+def _elementwise(a: Any, b: Any, name: str, function: Callable) -> Any:
+    """Apply the gcd or lcm function to each pair of a and b."""
+    if not (_is_numpy_array(a) or _is_numpy_array(b)):
+        a, b = list(a), list(b)
+        if len(a) != len(b):
+            raise ValueError(f"len(a)={len(a)} does not match len(b)={len(b)}")
+        return [function(x, y) for x, y in zip(a, b)]
+
+    # Third party
+    import numpy as np
+
+    a, b = np.asarray(a), np.asarray(b)
+    if a.dtype.kind in "iu" and b.dtype.kind in "iu":
+        if name == "gcd" or not _lcm_may_overflow(a, b):
+            return getattr(np, name)(a, b)
+        a, b = a.astype(object), b.astype(object)
+    return np.frompyfunc(function, 2, 1)(a, b)
+
+
+def _lcm_may_overflow(a: Any, b: Any) -> bool:
+    # Third party
+    import numpy as np
+
+    gcds = np.maximum(np.gcd(a, b), 1)
+    magnitude = np.abs(a / gcds) * np.abs(b.astype(np.float64))
+    return bool((magnitude >= 2**62).any())
@@ -7,6 +7,10 @@ requires_datetime = ["pytz"]
 requires_image = ["Pillow"]
 requires_io = ["pytz", "tzlocal"]
 requires_aws = ["boto3"]
+requires_arrow = ["numpy", "pyarrow"]
+requires_async = ["aiohttp"]
+requires_hash = ["xxhash"]
+requires_zstd = ["zstandard"]
 requires_tests = [
     "pytest",
     "pytest-cov",
@@ -20,6 +24,10 @@ requires_all = (
     + requires_image
     + requires_io
     + requires_aws
+    + requires_arrow
+    + requires_async
+    + requires_hash
+    + requires_zstd
     + requires_tests
 )
 
@@ -27,11 +35,15 @@ setup(
     package_data={"mpu": ["units/currencies.csv", "data/*", "package/templates/*"]},
     extras_require={
         "all": requires_all,
+        "arrow": requires_arrow,
+        "async": requires_async,
         "aws": requires_aws,
         "datetime": requires_datetime,
+        "hash": requires_hash,
         "image": requires_image,
         "io": requires_io,
         "tests": requires_tests,
+        "zstd": requires_zstd,
     },
     tests_require=requires_tests,
 )
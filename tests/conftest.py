@@ -1,5 +1,7 @@
 # Core Library
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from tempfile import mkstemp
 
 # Third party
@@ -53,3 +55,74 @@ def hdf5_tempfile():
     pathname = create_tempfile(suffix=".hdf5")
     yield pathname
     os.remove(pathname)
+
+
+@pytest.fixture
+def parquet_tempfile():
+    pathname = create_tempfile(suffix=".parquet")
+    yield pathname
+    os.remove(pathname)
+
+
+@pytest.fixture
+def feather_tempfile():
+    pathname = create_tempfile(suffix=".feather")
+    yield pathname
+    os.remove(pathname)
+
+
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+    """Serve server.files with keep-alive and support for range requests."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.nb_connections += 1
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def _respond(self, send_body):
+        self.server.requests.append((self.command, self.path, self.headers))
+        body = self.server.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        status = 200
+        range_header = self.headers.get("Range")
+        if range_header is not None and self.server.accept_ranges:
+            first, last = range_header.split("=")[1].split("-")
+            last = int(last) if last else len(body) - 1
+            body = body[int(first) : last + 1]
+            status = 206
+        self.send_response(status)
+        if self.server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """A local HTTP server which serves the bytes of the dict server.files."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeRequestHandler)
+    server.daemon_threads = True
+    server.files = {}
+    server.requests = []
+    server.nb_connections = 0
+    server.accept_ranges = True
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -1,6 +1,7 @@
 # Core Library
 import math
 import random
+from fractions import Fraction
 from typing import List, Set
 
 # Third party
@@ -13,11 +14,15 @@ from mpu.geometry import (
     EPSILON,
     LineSegment,
     Point,
+    SegmentArray,
+    SegmentIndex,
     _get_straight_line_intersection,
     crossproduct,
     do_bounding_boxes_intersect,
     do_lines_intersect,
+    get_all_intersecting_lines,
     get_all_intersecting_lines_by_brute_force,
+    is_point_on_line,
     is_point_right_of_line,
     line_segment_touches_or_crosses_line,
 )
@@ -419,12 +424,10 @@ def test_blog_example():
     intersectionsBrute: Set[LineSegment] = get_all_intersecting_lines_by_brute_force(
         lines
     )
-    # intersectionsSweep: Set[LineSegment] = getAllIntersectingLines(lines)
+    intersectionsSweep: Set[LineSegment] = get_all_intersecting_lines(lines)
 
     assert intersectionsBrute == intersections
-
-    # twice [e,g], but not [[d, g], [e, c], [e, d], [e, f]]
-    # assert intersectionsSweep == intersections
+    assert intersectionsSweep == intersections
 
 
 def test_compare_to_brute_force():
@@ -440,11 +443,271 @@ def test_compare_to_brute_force():
     intersectionsBrute: Set[LineSegment] = get_all_intersecting_lines_by_brute_force(
         lines
     )
-    # intersectionsSweep: Set[LineSegment] = getAllIntersectingLines(lines)
+    intersectionsSweep: Set[LineSegment] = get_all_intersecting_lines(lines)
     assert len(intersectionsBrute) <= max_intersections
-    # assert intersectionsBrute == intersectionsSweep
+    assert intersectionsBrute == intersectionsSweep
+
+
+@pytest.mark.parametrize("grid_size", [None, 2, 3, 10])
+def test_sweep_line_compare_to_brute_force(grid_size):
+    # Points on a small grid give many touching, collinear, vertical,
+    # horizontal and degenerate lines
+    rng = random.Random(grid_size)
+
+    def random_point() -> Point:
+        if grid_size is None:
+            return Point(rng.random(), rng.random())
+        return Point(rng.randint(0, grid_size), rng.randint(0, grid_size))
+
+    for _ in range(200):
+        lines = [
+            LineSegment(random_point(), random_point(), f"l{i}")
+            for i in range(rng.randint(0, 20))
+        ]
+        if lines and rng.random() < 0.2:
+            lines.append(lines[0])
+        expected = get_all_intersecting_lines_by_brute_force(lines)
+        assert get_all_intersecting_lines(lines) == expected
+
+
+def _do_lines_intersect_exactly(a: LineSegment, b: LineSegment) -> bool:
+    p1, p2, q1, q2 = [(Fraction(p.x), Fraction(p.y)) for p in [a.p1, a.p2, b.p1, b.p2]]
+
+    def orientation(o, s, t):
+        cross = (s[0] - o[0]) * (t[1] - o[1]) - (s[1] - o[1]) * (t[0] - o[0])
+        return (cross > 0) - (cross < 0)
+
+    def in_box(o, s, t):
+        x_min, x_max = min(o[0], s[0]), max(o[0], s[0])
+        y_min, y_max = min(o[1], s[1]), max(o[1], s[1])
+        return x_min <= t[0] <= x_max and y_min <= t[1] <= y_max
+
+    d1, d2 = orientation(p1, p2, q1), orientation(p1, p2, q2)
+    d3, d4 = orientation(q1, q2, p1), orientation(q1, q2, p2)
+    return (
+        (d1 * d2 < 0 and d3 * d4 < 0)
+        or (d1 == 0 and in_box(p1, p2, q1))
+        or (d2 == 0 and in_box(p1, p2, q2))
+        or (d3 == 0 and in_box(q1, q2, p1))
+        or (d4 == 0 and in_box(q1, q2, p2))
+    )
+
+
+def test_sweep_line_near_misses():
+    # do_lines_intersect accepts end points up to EPSILON / length away from
+    # the other line, which is 1.4e-4 here
+    a = LineSegment(Point(0, 0), Point(0.001, 0.001), "a")
+    b = LineSegment(Point(0.0004, 0.0006), Point(0.0002, 0.0009), "b")
+    assert get_all_intersecting_lines_by_brute_force([a, b]) == {frozenset({a, b})}
+    assert not _do_lines_intersect_exactly(a, b)
+    assert get_all_intersecting_lines([a, b]) == set()
+
+
+@pytest.mark.parametrize("scale", [1e-3, 1e-2, 1])
+def test_sweep_line_compare_to_brute_force_small_scale(scale):
+    # Short lines around (8, 49), like a road network in degrees
+    rng = random.Random(5)
+    for _ in range(50):
+        lines = []
+        for i in range(30):
+            x, y = 8 + rng.uniform(0, 10 * scale), 49 + rng.uniform(0, 10 * scale)
+            dx, dy = rng.uniform(-scale, scale), rng.uniform(-scale, scale)
+            lines.append(LineSegment(Point(x, y), Point(x + dx, y + dy), f"l{i}"))
+        brute_force = get_all_intersecting_lines_by_brute_force(lines)
+        expected = {pair for pair in brute_force if _do_lines_intersect_exactly(*pair)}
+        assert get_all_intersecting_lines(lines) == expected
 
 
 def test_get_straight_line_intersection():
     intersection = _get_straight_line_intersection(0, 0, 10, 5, 20)
     assert intersection == LineSegment(Point(0, 5), Point(0, 10))
+
+
+def _random_lines(rng: random.Random, n: int, max_length: float) -> List[LineSegment]:
+    lines = []
+    for i in range(n):
+        x, y = rng.uniform(-10, 10), rng.uniform(-10, 10)
+        dx, dy = rng.uniform(-1, 1) * max_length, rng.uniform(-1, 1) * max_length
+        lines.append(LineSegment(Point(x, y), Point(x + dx, y + dy), f"l{i}"))
+    return lines
+
+
+def test_segment_index_queries():
+    rng = random.Random(0)
+    lines = _random_lines(rng, 300, 1) + _random_lines(rng, 5, 30)
+    index = SegmentIndex(lines)
+    assert len(index) == len(lines)
+    for query in _random_lines(rng, 50, 5):
+        box = query.bounding_box()
+        expected = {
+            line
+            for line in lines
+            if do_bounding_boxes_intersect(box, line.bounding_box())
+        }
+        assert index.query_box(box) == expected
+        expected = {line for line in lines if do_lines_intersect(query, line)}
+        assert index.query_intersecting(query) == expected
+
+
+def test_segment_index_insert_delete():
+    rng = random.Random(1)
+    lines = _random_lines(rng, 100, 2)
+    index = SegmentIndex(lines[:50], cell_size=0.5)
+    for line in lines[50:]:
+        index.insert(line)
+    index.insert(lines[0])
+    assert len(index) == 100
+    for line in lines[::2]:
+        index.delete(line)
+    assert set(index) == set(lines[1::2])
+    assert lines[0] not in index
+    with pytest.raises(KeyError):
+        index.delete(lines[0])
+    everything = (Point(-100, -100), Point(100, 100))
+    assert index.query_box(everything) == set(lines[1::2])
+
+
+def test_segment_index_starts_empty():
+    rng = random.Random(2)
+    lines = []
+    for i in range(2000):
+        x, y = rng.uniform(0, 1e5), rng.uniform(0, 1e5)
+        angle = rng.uniform(0, 2 * math.pi)
+        end = Point(x + 200 * math.cos(angle), y + 200 * math.sin(angle))
+        lines.append(LineSegment(Point(x, y), end, f"l{i}"))
+    index = SegmentIndex()
+    for line in lines:
+        index.insert(line)
+    assert 100 < index.cell_size < 400
+    assert not index._large
+    for query in lines[:20]:
+        expected = {line for line in lines if do_lines_intersect(query, line)}
+        assert index.query_intersecting(query) == expected
+
+    fixed = SegmentIndex(cell_size=1)
+    for line in lines[:100]:
+        fixed.insert(line)
+    assert fixed.cell_size == 1
+    assert len(fixed._large) == 100
+
+
+def test_segment_index_invalid_cell_size():
+    with pytest.raises(ValueError):
+        SegmentIndex(cell_size=0)
+
+
+def _random_grid_lines(rng: random.Random, n: int) -> List[LineSegment]:
+    """Lines with many touching, collinear and degenerate cases."""
+    return [
+        LineSegment(
+            Point(rng.randint(0, 4), rng.randint(0, 4)),
+            Point(rng.randint(0, 4), rng.randint(0, 4)),
+        )
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("grid", [False, True])
+def test_segment_array_one_vs_many(grid):
+    np = pytest.importorskip("numpy")
+    rng = random.Random(2)
+    lines = _random_grid_lines(rng, 200) if grid else _random_lines(rng, 200, 5)
+    segments = SegmentArray.from_line_segments(lines)
+    assert len(segments) == 200
+    assert (segments[3].p1, segments[3].p2) == (lines[3].p1, lines[3].p2)
+    for query in lines[:20]:
+        intersecting = [do_lines_intersect(query, line) for line in lines]
+        assert segments.intersects(query).tolist() == intersecting
+
+        box = query.bounding_box()
+        expected = [
+            do_bounding_boxes_intersect(box, line.bounding_box()) for line in lines
+        ]
+        assert segments.filter_box(box).tolist() == expected
+
+        orientation = segments.orientation(query.p1)
+        for line, side in zip(lines, orientation):
+            if is_point_on_line(line, query.p1):
+                assert side == 0
+            else:
+                assert (side == -1) == is_point_right_of_line(line, query.p1)
+
+        x, y = segments.intersection_points(query)
+        for line, px, py, intersects in zip(lines, x, y, intersecting):
+            if np.isnan(px):
+                continue
+            assert intersects
+            assert is_point_on_line(line, Point(px, py))
+            assert is_point_on_line(query, Point(px, py))
+
+
+@pytest.mark.parametrize("max_chunk_size", [1, 50, 2**22])
+def test_segment_array_intersecting_pairs(max_chunk_size):
+    pytest.importorskip("numpy")
+    rng = random.Random(3)
+    lines = _random_grid_lines(rng, 60)
+    segments = SegmentArray.from_line_segments(lines)
+    i, j, x, y = segments.intersecting_pairs(
+        max_chunk_size=max_chunk_size, return_points=True
+    )
+    expected = {
+        (a, b)
+        for a in range(len(lines))
+        for b in range(a + 1, len(lines))
+        if do_lines_intersect(lines[a], lines[b])
+    }
+    assert set(zip(i.tolist(), j.tolist())) == expected
+    assert len(x) == len(y) == len(i)
+
+    others = SegmentArray.from_line_segments(lines[:7])
+    i, j = segments.intersecting_pairs(others, max_chunk_size=max_chunk_size)
+    expected = {
+        (a, b)
+        for a in range(len(lines))
+        for b in range(7)
+        if do_lines_intersect(lines[a], lines[b])
+    }
+    assert set(zip(i.tolist(), j.tolist())) == expected
+
+
+def test_segment_array_invalid():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        SegmentArray([0, 1], [0, 1], [0], [0])
+    assert len(SegmentArray.from_line_segments([]).intersecting_pairs()[0]) == 0
+
+
+def test_brute_force_benchmark(benchmark):
+    rng = random.Random(4)
+    lines = _random_lines(rng, 200, 3)
+    result = benchmark(get_all_intersecting_lines_by_brute_force, lines)
+    assert result == get_all_intersecting_lines(lines)
+
+
+def test_slots():
+    line = LineSegment(Point(0, 0), Point(1, 1))
+    with pytest.raises(AttributeError):
+        line.color = "red"
+    with pytest.raises(AttributeError):
+        line.p1.z = 0
+
+
+def test_line_segment_cache_is_cleared():
+    line = LineSegment(Point(0, 0), Point(1, 1))
+    assert line.angle() == 45
+    assert line.bounding_box() == (Point(0, 0), Point(1, 1))
+    assert line._get_equation_parameters() == (1, 0)
+    line.p2 = Point(-1, 0)
+    assert line.angle() == 180
+    assert line.bounding_box() == (Point(-1, 0), Point(0, 0))
+    assert line._get_equation_parameters() == (0, 0)
+
+
+def test_line_segment_cache_after_point_is_modified():
+    line = LineSegment(Point(0, 0), Point(1, 1))
+    assert line.angle() == 45
+    line.p2.y = -1
+    assert line.angle() == 45  # stale, as documented
+    line.p2 = line.p2
+    assert line.angle() == 315
+    assert line.bounding_box() == (Point(0, -1), Point(1, 0))
@@ -3,10 +3,16 @@
 """Test the mpu.io module."""
 
 # Core Library
+import asyncio
 import datetime
+import gzip
+import hashlib
 import os
+import pickle
 import sys
+import time
 from unittest import mock
+from urllib.error import HTTPError
 
 # Third party
 import pkg_resources
@@ -55,6 +61,21 @@ def test_get_file_meta():
     assert meta == expected
 
 
+def test_get_files_meta():
+    sources = [
+        pkg_resources.resource_filename(__name__, path)
+        for path in ["files/example.json", "files/example.csv"]
+    ]
+    with mock.patch.dict(sys.modules, {"magic": None}):
+        metas = mpu.io.get_files_meta(sources, max_workers=2)
+    assert [meta["filepath"] for meta in metas] == [
+        os.path.abspath(source) for source in sources
+    ]
+    for meta, source in zip(metas, sources):
+        assert meta["modification_datetime"] == mpu.io.get_modification_datetime(source)
+        assert "mime" not in meta
+
+
 def test_urlread():
     url = "http://example.com"
     sample = urlread(url)
@@ -72,6 +93,159 @@ def test_download_without_path():
     os.remove(sink)  # cleanup of mkstemp
 
 
+def test_downloader_urlread_reuses_connection(http_server):
+    http_server.files["/a.txt"] = "Hällo".encode("utf8")
+    http_server.files["/b.txt"] = b"World"
+    with mpu.io.Downloader() as downloader:
+        assert urlread(http_server.url + "/a.txt", downloader=downloader) == "Hällo"
+        assert downloader.urlread(http_server.url + "/b.txt") == "World"
+    assert http_server.nb_connections == 1
+
+
+def test_downloader_segments(http_server, tmp_path):
+    content = bytes(range(256)) * 40
+    http_server.files["/data.bin"] = content
+    sink = str(tmp_path / "data.bin")
+    downloader = mpu.io.Downloader(segments=4, min_segment_size=1000)
+    assert download(http_server.url + "/data.bin", sink, downloader) == sink
+    with open(sink, "rb") as fp:
+        assert fp.read() == content
+    ranges = [headers["Range"] for method, _, headers in http_server.requests[1:]]
+    assert sorted(ranges) == sorted(
+        ["bytes=0-2559", "bytes=2560-5119", "bytes=5120-7679", "bytes=7680-10239"]
+    )
+    assert os.listdir(str(tmp_path)) == ["data.bin"]
+
+
+def test_downloader_resume(http_server, tmp_path):
+    content = b"0123456789" * 100
+    http_server.files["/data.bin"] = content
+    sink = str(tmp_path / "data.bin")
+    with open(sink + ".part0", "wb") as fp:
+        fp.write(content[:300])
+    downloader = mpu.io.Downloader(segments=1)
+    downloader.download(http_server.url + "/data.bin", sink)
+    with open(sink, "rb") as fp:
+        assert fp.read() == content
+    assert http_server.requests[-1][2]["Range"] == "bytes=300-999"
+
+
+def test_downloader_without_ranges(http_server, tmp_path):
+    http_server.accept_ranges = False
+    http_server.files["/a.txt"] = b"foo"
+    http_server.files["/b.txt"] = b"bar"
+    sources = [http_server.url + "/a.txt", http_server.url + "/b.txt"]
+    sinks = mpu.io.Downloader().download_many(sources, str(tmp_path))
+    assert sinks == {
+        sources[0]: str(tmp_path / "a.txt"),
+        sources[1]: str(tmp_path / "b.txt"),
+    }
+    with open(sinks[sources[1]], "rb") as fp:
+        assert fp.read() == b"bar"
+
+
+def test_downloader_duplicate_sinks(http_server, tmp_path):
+    http_server.files["/x/data.csv"] = b"foo"
+    http_server.files["/y/data.csv"] = b"bar"
+    sources = [http_server.url + "/x/data.csv", http_server.url + "/y/data.csv"]
+    with pytest.raises(ValueError, match="same sink"):
+        mpu.io.Downloader().download_many(sources, str(tmp_path))
+    assert http_server.requests == []
+    assert os.listdir(str(tmp_path)) == []
+
+    sinks = mpu.io.Downloader().download_many(sources[:1] * 3, str(tmp_path))
+    assert sinks == {sources[0]: str(tmp_path / "data.csv")}
+    assert [method for method, _, _ in http_server.requests] == ["HEAD", "GET"]
+    assert (tmp_path / "data.csv").read_bytes() == b"foo"
+
+
+def test_downloader_not_found(http_server):
+    with pytest.raises(HTTPError):
+        mpu.io.Downloader().urlread(http_server.url + "/missing")
+
+
+def test_aurlread(http_server):
+    pytest.importorskip("aiohttp")
+    for i in range(5):
+        http_server.files[f"/{i}.txt"] = str(i).encode()
+
+    async def main():
+        async with mpu.io.create_async_session(limit_per_host=1) as session:
+            return await asyncio.gather(
+                *[
+                    mpu.io.aurlread(f"{http_server.url}/{i}.txt", session=session)
+                    for i in range(5)
+                ]
+            )
+
+    assert asyncio.run(main()) == ["0", "1", "2", "3", "4"]
+    assert http_server.nb_connections == 1
+
+
+def test_aurlread_not_found(http_server):
+    aiohttp = pytest.importorskip("aiohttp")
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(mpu.io.aurlread(http_server.url + "/missing"))
+
+
+def test_adownload(http_server, tmp_path):
+    pytest.importorskip("aiohttp")
+    content = b"0123456789" * 1000
+    http_server.files["/data.bin"] = content
+    sink = str(tmp_path / "data.bin")
+    coroutine = mpu.io.adownload(http_server.url + "/data.bin", sink, chunk_size=7)
+    assert asyncio.run(coroutine) == sink
+    with open(sink, "rb") as fp:
+        assert fp.read() == content
+
+
+def test_adownload_does_not_block_loop(http_server, tmp_path, monkeypatch):
+    pytest.importorskip("aiohttp")
+    http_server.files["/data.bin"] = b"0123456789"
+    sink = str(tmp_path / "data.bin")
+    fsync = os.fsync
+
+    def slow_fsync(fd):
+        time.sleep(0.3)
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", slow_fsync)
+
+    async def main():
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        await mpu.io.adownload(http_server.url + "/data.bin", sink)
+        ticker.cancel()
+        return ticks
+
+    ticks = asyncio.run(main())
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.2
+    with open(sink, "rb") as fp:
+        assert fp.read() == b"0123456789"
+
+
+def test_adownload_failure_keeps_sink(http_server, tmp_path, monkeypatch):
+    pytest.importorskip("aiohttp")
+    http_server.files["/data.bin"] = b"new"
+    sink = tmp_path / "data.bin"
+    sink.write_bytes(b"old")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError, match="disk full"):
+        asyncio.run(mpu.io.adownload(http_server.url + "/data.bin", str(sink)))
+    assert os.listdir(str(tmp_path)) == ["data.bin"]
+    assert sink.read_bytes() == b"old"
+
+
 def test_read_csv():
     path = "files/example.csv"
     source = pkg_resources.resource_filename(__name__, path)
@@ -117,6 +291,116 @@ def test_read_csv_dicts():
     assert data_real == data_exp
 
 
+def test_read_csv_columns():
+    np = pytest.importorskip("numpy")
+    path = "files/example.csv"
+    source = pkg_resources.resource_filename(__name__, path)
+    data_real = read(source, format="columns")
+    assert list(data_real.keys()) == ["a", "b", "c"]
+    assert data_real["a"].dtype == np.float64
+    np.testing.assert_array_equal(data_real["a"], [1, 42, 1337, 0, -2, 3.141])
+    assert data_real["b"][0] == "A towel,"
+    np.testing.assert_array_equal(data_real["c"], [1.0, 2.0, -1, 123, 3, 2.7])
+
+
+def test_read_csv_columns_dtypes(csv_tempfile):
+    np = pytest.importorskip("numpy")
+    data = [
+        ["id", "flag", "score", "name"],
+        ["1", "yes", "0.5", "foo"],
+        ["2", "no", "", "null"],
+        ["3", "", "1.5", "bar"],
+    ]
+    write(csv_tempfile, data)
+    columns = read(csv_tempfile, format="columns", dtypes={"id": "str"})
+    assert list(columns["id"]) == ["1", "2", "3"]
+    assert list(columns["flag"]) == [True, False, None]
+    assert np.isnan(columns["score"][1])
+    assert list(columns["name"]) == ["foo", None, "bar"]
+
+    columns = read(csv_tempfile, format="columns", skiprows=[3])
+    assert columns["id"].dtype == np.int64
+    assert columns["flag"].dtype == np.bool_
+    assert list(columns["id"]) == [1, 2]
+
+    with pytest.raises(NotImplementedError):
+        read(csv_tempfile, format="columns", dtypes={"id": "complex"})
+
+
+def test_read_csv_columns_arrow(csv_tempfile):
+    pytest.importorskip("pyarrow")
+    data = [["id", "flag"], ["1", "yes"], ["", "no"]]
+    write(csv_tempfile, data)
+    columns = read(csv_tempfile, format="columns", backend="arrow")
+    assert columns["id"].to_pylist() == [1, None]
+    assert columns["flag"].to_pylist() == [True, False]
+
+
+def test_read_csv_columns_ragged(csv_tempfile):
+    pytest.importorskip("numpy")
+    with open(csv_tempfile, "w") as fp:
+        fp.write("id,name\n1,foo\n\n2\n")
+    with pytest.raises(ValueError, match="Line 4 has 1 values"):
+        read(csv_tempfile, format="columns")
+    with open(csv_tempfile, "w") as fp:
+        fp.write("id,name\n1,foo\n2,bar,baz\n")
+    with pytest.raises(ValueError, match="Line 3 has 3 values"):
+        read(csv_tempfile, format="columns")
+
+
+def test_read_csv_schema():
+    path = "files/example.csv"
+    source = pkg_resources.resource_filename(__name__, path)
+    schema = {"c": "float", "a": float}
+    data_real = read(source, format="dicts", schema=schema)
+    assert data_real[:2] == [{"c": 1.0, "a": 1.0}, {"c": 2.0, "a": 42.0}]
+    data_real = read(source, format="tuples", schema=schema)
+    assert data_real[-1] == (2.7, 3.141)
+    with pytest.raises(ValueError):
+        read(source, format="tuples", schema={"a": "int"})
+    with pytest.raises(ValueError):
+        read(source, format="tuples", schema={"d": "int"})
+
+
+def test_iter_csv_records(csv_tempfile):
+    data = [["id", "name", "active"], ["1", "foo", "yes"], ["2", "bar", "no"]]
+    write(csv_tempfile, data)
+    schema = {"id": "int", "active": "bool", "name": str.upper}
+    records = mpu.io.iter_csv(csv_tempfile, schema, format="records")
+    first = next(records)
+    assert (first.id, first.name, first.active) == (1, "FOO", True)
+    assert not hasattr(first, "__dict__")
+    assert first.as_dict() == {"id": 1, "active": True, "name": "FOO"}
+    assert [record.id for record in records] == [2]
+    rows = mpu.io.iter_csv(csv_tempfile, format="tuples", skiprows=[1])
+    assert list(rows) == [("2", "bar", "no")]
+
+
+def test_iter_csv_records_rename(csv_tempfile):
+    data = [["first name", "class", "age"], ["Ada", "A", "36"]]
+    write(csv_tempfile, data)
+    schema = {"first name": "str", "class": "str", "age": "int"}
+    (record,) = mpu.io.iter_csv(csv_tempfile, schema, format="records")
+    assert record.as_dict() == {"_0": "Ada", "_1": "A", "age": 36}
+
+
+def test_make_record_class_invalid_field():
+    with pytest.raises(ValueError, match="Invalid field name 'first name'"):
+        mpu.io.make_record_class("Person", ["first name"])
+    with pytest.raises(ValueError, match="Invalid field name 'as_dict'"):
+        mpu.io.make_record_class("Person", ["as_dict"])
+    with pytest.raises(ValueError, match="Invalid field name 'age'"):
+        mpu.io.make_record_class("Person", ["age", "age"])
+
+
+def test_read_csv_schema_invalid(csv_tempfile):
+    write(csv_tempfile, [["id"], ["1"]])
+    with pytest.raises(ValueError, match="format='default'"):
+        read(csv_tempfile, schema={"id": "int"})
+    with pytest.raises(ValueError, match=r"Valid converter names are \['int'"):
+        read(csv_tempfile, format="dicts", schema={"id": "integer"})
+
+
 def test_write_csv(csv_tempfile):
     newline = "\n"
     data = [
@@ -191,6 +475,42 @@ def test_read_jsonl():
         assert real == exp_
 
 
+def test_jsonl_tail(tmp_path):
+    filepath = str(tmp_path / "log.jsonl")
+    with mpu.io.JsonlTail(filepath) as tail:
+        assert tail.read_new() == []
+        with open(filepath, "w") as fp:
+            fp.write('{"a": 1}\n{"a": 2}\n{"a"')
+        assert tail.read_new() == [{"a": 1}, {"a": 2}]
+        assert tail.offset == 18
+        with open(filepath, "a") as fp:
+            fp.write(": 3}\n")
+        assert tail.read_new() == [{"a": 3}]
+        assert tail.read_new() == []
+
+        # Rotation: the rest of the old file is read before the new file
+        with open(filepath, "a") as fp:
+            fp.write('{"a": 4}\n')
+        os.rename(filepath, filepath + ".1")
+        with open(filepath, "w") as fp:
+            fp.write('{"b": 1}\n')
+        assert tail.read_new() == [{"a": 4}, {"b": 1}]
+
+        # Truncation
+        with open(filepath, "w") as fp:
+            fp.write("[]\n")
+        assert tail.read_new() == [[]]
+
+
+def test_jsonl_tail_follow(tmp_path):
+    filepath = str(tmp_path / "log.jsonl")
+    write(filepath, [{"a": 1}, {"a": 2}])
+    use_inotify = sys.platform.startswith("linux")
+    with mpu.io.JsonlTail(filepath, offset=9, use_inotify=use_inotify) as tail:
+        records = tail.follow(poll_interval=0.01, idle_timeout=0.05)
+        assert list(records) == [{"a": 2}]
+
+
 def test_read_pickle():
     path = "files/example.pickle"
     source = pkg_resources.resource_filename(__name__, path)
@@ -281,6 +601,183 @@ def test_write_pickle_protocol(pickle_tempfile):
     assert data == data_read
 
 
+def test_write_parquet(parquet_tempfile):
+    pytest.importorskip("pyarrow")
+    data = [
+        {"year": 2019, "name": "foo"},
+        {"year": 2020, "name": "bar"},
+        {"year": 2021, "name": "baz"},
+    ]
+    write(parquet_tempfile, data, row_group_size=1)
+    table = read(parquet_tempfile)
+    assert table.to_pylist() == data
+
+    table = read(parquet_tempfile, columns=["name"], filters=[("year", ">=", 2020)])
+    assert table.to_pylist() == [{"name": "bar"}, {"name": "baz"}]
+
+    table = read(parquet_tempfile, row_groups=[0, 2], columns=["year"])
+    assert table.to_pylist() == [{"year": 2019}, {"year": 2021}]
+
+
+def test_write_parquet_streaming(parquet_tempfile):
+    pq = pytest.importorskip("pyarrow.parquet")
+    chunks = ({"x": list(range(i * 10, (i + 1) * 10))} for i in range(3))
+    write(parquet_tempfile, chunks)
+    assert pq.ParquetFile(parquet_tempfile).num_row_groups == 3
+    assert read(parquet_tempfile)["x"].to_pylist() == list(range(30))
+
+
+def test_write_feather(feather_tempfile):
+    pytest.importorskip("pyarrow")
+    data = {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+    write(feather_tempfile, data, compression="zstd")
+    assert read(feather_tempfile).to_pydict() == data
+    assert read(feather_tempfile, columns=["b"]).to_pydict() == {"b": data["b"]}
+
+    chunks = iter([{"a": [1]}, {"a": [2, 3]}])
+    write(feather_tempfile, chunks)
+    assert read(feather_tempfile).to_pydict() == {"a": [1, 2, 3]}
+
+
+requires_protocol_5 = pytest.mark.skipif(
+    pickle.HIGHEST_PROTOCOL < 5, reason="Pickle protocol 5 requires Python 3.8+"
+)
+
+
+@requires_protocol_5
+def test_write_pickle_out_of_band(pickle_tempfile):
+    np = pytest.importorskip("numpy")
+    data = {"weights": np.arange(100000, dtype=np.float64), "name": "model"}
+    write(pickle_tempfile, data, out_of_band=True)
+    data_read = read(pickle_tempfile)
+    assert data_read["name"] == "model"
+    np.testing.assert_array_equal(data_read["weights"], data["weights"])
+    assert data_read["weights"].ctypes.data % 64 == 0
+    assert not data_read["weights"].flags.owndata
+
+    # Changing the memory-mapped array does not change the file
+    data_read["weights"][0] = 42
+    np.testing.assert_array_equal(read(pickle_tempfile)["weights"], data["weights"])
+
+
+def test_read_pickle_allowed_globals(pickle_tempfile):
+    data = {"date": datetime.date(2022, 6, 22)}
+    write(pickle_tempfile, data)
+    with pytest.raises(pickle.UnpicklingError):
+        read(pickle_tempfile, allowed_globals=[])
+    assert read(pickle_tempfile, allowed_globals=["datetime.date"]) == data
+
+
+@requires_protocol_5
+def test_read_pickle_out_of_band_allowed_globals(pickle_tempfile):
+    data = {"date": datetime.date(2022, 6, 22)}
+    write(pickle_tempfile, data, out_of_band=True)
+    with pytest.raises(pickle.UnpicklingError):
+        read(pickle_tempfile, allowed_globals=["builtins.eval"])
+    assert read(pickle_tempfile, allowed_globals=["datetime.date"]) == data
+
+
+def test_write_pickle_out_of_band_without_protocol_5(pickle_tempfile, monkeypatch):
+    monkeypatch.setattr(pickle, "HIGHEST_PROTOCOL", 4)
+    with pytest.raises(ValueError, match="protocol 5"):
+        write(pickle_tempfile, {"a": 1}, out_of_band=True)
+
+
+@pytest.mark.parametrize(
+    "extension, data",
+    [
+        (".csv", [["a", "b"], ["1", "2"]]),
+        (".json", {"a": [1, 2], "b": "c"}),
+        (".jsonl", [{"a": 1}, {"b": [2, 3]}]),
+        (".pickle", {"a": {1, 2}}),
+        (".csv.gz", [["a", "b"], ["1", "2"]]),
+        (".jsonl.gz", [{"a": 1}, {"b": [2, 3]}]),
+    ],
+)
+def test_read_without_extension(tmp_path, extension, data):
+    filepath = str(tmp_path / f"data{extension}")
+    write(filepath, data)
+    assert read(filepath) == data
+    without_extension = str(tmp_path / "data")
+    os.rename(filepath, without_extension)
+    assert read(without_extension) == data
+
+
+def test_read_without_extension_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    filepath = str(tmp_path / "data.parquet")
+    write(filepath, {"a": [1, 2]})
+    os.rename(filepath, str(tmp_path / "data"))
+    assert read(str(tmp_path / "data")).to_pydict() == {"a": [1, 2]}
+
+
+def test_write_zstd_compressed(tmp_path):
+    pytest.importorskip("zstandard")
+    data = [{"a": 1}, {"b": [2, 3]}]
+    filepath = str(tmp_path / "data.jsonl.zst")
+    write(filepath, data)
+    assert read(filepath) == data
+
+
+def test_register_format(tmp_path):
+    filepath = str(tmp_path / "data.txt")
+    with open(filepath, "w") as fp:
+        fp.write("Don't panic!")
+    with pytest.raises(NotImplementedError):
+        read(filepath)
+
+    def read_text(filepath, kwargs):
+        with open(filepath) as fp:
+            return fp.read()
+
+    mpu.io.register_format("text", [".txt"], read_text, priority=100)
+    try:
+        assert read(filepath) == "Don't panic!"
+        with pytest.raises(NotImplementedError):
+            write(filepath, "data")
+    finally:
+        mpu.io._FORMATS.remove(mpu.io._get_format_by_extension(filepath))
+
+
+def test_write_atomic(json_tempfile):
+    data = {"a list": [1, 42, 3.141, 1337, "help", "€"]}
+    write(json_tempfile, data, atomic=True)
+    assert read(json_tempfile) == data
+
+    directory, basename = os.path.split(json_tempfile)
+    with pytest.raises(TypeError):
+        write(json_tempfile, {"not serializable": object()}, atomic=True)
+    assert read(json_tempfile) == data
+    leftovers = [name for name in os.listdir(directory) if name.endswith(basename)]
+    assert leftovers == [basename]
+
+
+def test_write_atomic_pickle(pickle_tempfile):
+    data = {"a string": "bla"}
+    write(pickle_tempfile, data, atomic=True, protocol=0)
+    assert read(pickle_tempfile) == data
+
+
+def test_atomic_path(tmp_path):
+    sink = tmp_path / "data.txt"
+    sink.write_text("old")
+    with pytest.raises(ValueError):
+        with mpu.io.atomic_path(str(sink)) as tmp:
+            with open(tmp, "w") as fp:
+                fp.write("partial")
+            raise ValueError
+    assert os.listdir(str(tmp_path)) == ["data.txt"]
+    assert sink.read_text() == "old"
+
+    with mpu.io.atomic_path(str(sink)) as tmp:
+        assert tmp.endswith(".data.txt")
+        with open(tmp, "w") as fp:
+            fp.write("new")
+        assert sink.read_text() == "old"
+    assert os.listdir(str(tmp_path)) == ["data.txt"]
+    assert sink.read_text() == "new"
+
+
 def test_read_h5():
     source = pkg_resources.resource_filename("mpu", "io.py")
     with pytest.raises(NotImplementedError):
@@ -293,6 +790,54 @@ def test_gzip(pickle_tempfile):
     gzip_file(source, pickle_tempfile)
 
 
+def test_gzip_atomic(pickle_tempfile):
+    path = "files/example.csv"
+    source = pkg_resources.resource_filename(__name__, path)
+    gzip_file(source, pickle_tempfile, atomic=True)
+    with gzip.open(pickle_tempfile, "rb") as fp, open(source, "rb") as original:
+        assert fp.read() == original.read()
+
+
+def test_gzip_blocks(tmp_path):
+    content = os.urandom(3000) + b"a" * 5000
+    source = str(tmp_path / "data.bin")
+    with open(source, "wb") as fp:
+        fp.write(content)
+    sink = str(tmp_path / "data.bin.gz")
+    gzip_file(source, sink, level=6, block_size=1000, max_workers=3)
+    with gzip.open(sink, "rb") as fp:
+        assert fp.read() == content
+
+    restored = str(tmp_path / "restored.bin")
+    mpu.io.gunzip_file(sink, restored, atomic=True)
+    with open(restored, "rb") as fp:
+        assert fp.read() == content
+
+
+def test_gzip_empty(tmp_path):
+    source = str(tmp_path / "empty.txt")
+    open(source, "w").close()
+    sink = str(tmp_path / "empty.txt.gz")
+    gzip_file(source, sink)
+    with gzip.open(sink, "rb") as fp:
+        assert fp.read() == b""
+
+
+def test_zstd(tmp_path):
+    pytest.importorskip("zstandard")
+    content = b"Don't panic! " * 1000
+    source = str(tmp_path / "data.txt")
+    with open(source, "wb") as fp:
+        fp.write(content)
+    sink = str(tmp_path / "data.txt.zst")
+    mpu.io.zstd_file(source, sink, atomic=True, level=10)
+    restored = str(tmp_path / "restored.txt")
+    mpu.io.unzstd_file(sink, restored)
+    with open(restored, "rb") as fp:
+        assert fp.read() == content
+    assert os.path.getsize(sink) < len(content)
+
+
 def test_hash():
     path = "files/example.pickle"
     source = pkg_resources.resource_filename(__name__, path)
@@ -301,6 +846,70 @@ def test_hash():
     assert mpu.io.hash(source, method="md5") == expected_hash_md5
 
 
+def test_hashes():
+    path = "files/example.pickle"
+    source = pkg_resources.resource_filename(__name__, path)
+    with open(source, "rb") as fp:
+        content = fp.read()
+    expected = {
+        "sha1": "e845794fde22e7a33dd389ed0f5381ae042154c1",
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "blake2b": hashlib.blake2b(content).hexdigest(),
+    }
+    assert mpu.io.hashes(source, expected.keys(), buffer_size=7) == expected
+    assert mpu.io.hash(source, method="sha256") == expected["sha256"]
+
+
+def test_hash_xxhash():
+    xxhash = pytest.importorskip("xxhash")
+    path = "files/example.pickle"
+    source = pkg_resources.resource_filename(__name__, path)
+    with open(source, "rb") as fp:
+        expected = xxhash.xxh3_64(fp.read()).hexdigest()
+    assert mpu.io.hash(source, method="xxh3_64") == expected
+
+
+def test_hash_unknown_method():
+    path = "files/example.pickle"
+    source = pkg_resources.resource_filename(__name__, path)
+    with pytest.raises(NotImplementedError):
+        mpu.io.hash(source, method="sha42")
+
+
+def test_hash_many():
+    sources = [
+        pkg_resources.resource_filename(__name__, path)
+        for path in ["files/example.pickle", "files/example.csv"]
+    ]
+    assert mpu.io.hash_many(sources, method="md5", max_workers=2) == {
+        source: mpu.io.hash(source, method="md5") for source in sources
+    }
+
+
+def test_hash_cache(tmp_path):
+    filepath = str(tmp_path / "data.txt")
+    with open(filepath, "w") as fp:
+        fp.write("foo")
+    with mpu.io.HashCache(str(tmp_path / "cache.sqlite")) as cache:
+        digest = mpu.io.hash(filepath, cache=cache)
+        assert digest == hashlib.sha1(b"foo").hexdigest()
+        with mock.patch("mpu.io.hashes") as hashes_mock:
+            assert mpu.io.hash(filepath, cache=cache) == digest
+        hashes_mock.assert_not_called()
+
+        with open(filepath, "w") as fp:
+            fp.write("foobar")
+        assert cache.hash(filepath) == hashlib.sha1(b"foobar").hexdigest()
+        assert cache.prune() == 0
+
+    with mpu.io.HashCache(str(tmp_path / "cache.sqlite")) as cache:
+        assert mpu.io.hash_many([filepath], cache=cache) == {
+            filepath: hashlib.sha1(b"foobar").hexdigest()
+        }
+        os.remove(filepath)
+        assert cache.prune() == 1
+
+
 def test_get_creation_datetime():
     ret_val = mpu.io.get_creation_datetime(__file__)
     assert isinstance(ret_val, datetime.datetime) or ret_val is None
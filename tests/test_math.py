@@ -2,6 +2,7 @@
 
 
 # Core Library
+import functools
 import itertools
 
 # Third party
@@ -100,3 +101,295 @@ def test_gcd_is_divisor_min_size(a, b, c):
 def test_generate_primes():
     first_primes = list(itertools.islice(mpu.math.generate_primes(), 10))
     assert first_primes == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+
+def test_generate_primes_segments():
+    primes = list(itertools.islice(mpu.math.generate_primes(), 100000))
+    assert primes == mpu.math.primes_up_to(1299709)
+
+
+def test_primes_up_to_beyond_table_is_segmented(monkeypatch):
+    expected = mpu.math.primes_up_to(10**6)
+    monkeypatch.setattr(mpu.math, "prime_table", mpu.math.PrimeTable(max_limit=100))
+    monkeypatch.setattr(mpu.math, "_SEGMENT_SIZE", 1000)
+    sieve_table = mpu.math._sieve_table
+
+    def small_sieve_table(n):
+        assert n <= 1000
+        return sieve_table(n)
+
+    monkeypatch.setattr(mpu.math, "_sieve_table", small_sieve_table)
+    assert mpu.math.primes_up_to(10**6) == expected
+
+
+@given(st.integers(min_value=-10, max_value=3000), st.integers(0, 3000))
+def test_primes_in_range(a, length):
+    expected = [
+        p
+        for p in range(max(a, 2), a + length)
+        if all(p % d != 0 for d in range(2, int(p**0.5) + 1))
+    ]
+    assert mpu.math.primes_in_range(a, a + length) == expected
+
+
+def test_is_prime_small():
+    primes = set(mpu.math.primes_up_to(10000))
+    assert [n for n in range(-10, 10001) if mpu.math.is_prime(n)] == sorted(primes)
+
+
+@pytest.mark.parametrize(
+    "number",
+    [
+        2047,  # strong pseudoprime to base 2
+        3215031751,  # strong pseudoprime to bases 2, 3, 5 and 7
+        3825123056546413051,  # strong pseudoprime to bases 2, ..., 23
+        3317044064679887385961981,  # strong pseudoprime to bases 2, ..., 37
+        (2**61 - 1) * (2**89 - 1),
+    ],
+)
+def test_is_prime_pseudoprimes(number):
+    assert not mpu.math.is_prime(number)
+
+
+def test_is_prime_big(benchmark):
+    assert benchmark(mpu.math.is_prime, 2**127 - 1)
+
+
+def test_is_prime_float():
+    with pytest.raises(ValueError):
+        mpu.math.is_prime(17.0)
+
+
+def test_are_prime_numpy():
+    np = pytest.importorskip("numpy")
+    numbers = np.arange(-5, 95).reshape(10, 10)
+    result = mpu.math.are_prime(numbers)
+    assert result.shape == (10, 10)
+    assert result.tolist() == [
+        [mpu.math.is_prime(int(n)) for n in row] for row in numbers
+    ]
+    big = np.array([2**61 - 1, 2**62], dtype=np.uint64)
+    assert mpu.math.are_prime(big).tolist() == [True, False]
+
+
+@given(st.lists(st.sampled_from([2, 3, 997, 1009, 65537, 1000000007]), max_size=4))
+def test_factorize_sorted(primes):
+    number = 1
+    for prime in primes:
+        number *= prime
+    expected = sorted(primes) if primes else [1]
+    assert mpu.math.factorize(number) == expected
+
+
+def test_factorize_semiprime(benchmark):
+    p, q = 2**31 - 1, 2**61 - 1
+    assert benchmark(mpu.math.factorize, p * q) == [p, q]
+
+
+def test_factorize_as_counter():
+    counter = mpu.math.factorize(-(2**10) * 3 * 1000000007**2, as_counter=True)
+    assert counter == {-1: 1, 2: 10, 3: 1, 1000000007: 2}
+
+
+@given(st.lists(st.integers(min_value=-(10**5), max_value=10**5).filter(bool)))
+def test_factorize_many(numbers):
+    pytest.importorskip("numpy")
+    expected = [mpu.math.factorize(number) for number in numbers]
+    assert mpu.math.factorize_many(numbers) == expected
+
+
+def test_factorize_many_beyond_table():
+    pytest.importorskip("numpy")
+    numbers = [10**6 + 3, 2**61 - 1, -1000, 1]
+    expected = [mpu.math.factorize(number) for number in numbers]
+    assert mpu.math.factorize_many(numbers, max_table_size=1000) == expected
+
+
+def test_factorize_many_numpy(benchmark):
+    np = pytest.importorskip("numpy")
+    numbers = np.arange(1, 10**5)
+    result = benchmark(mpu.math.factorize_many, numbers)
+    assert result[:12] == [mpu.math.factorize(n) for n in range(1, 13)]
+
+
+def test_factorize_many_zero():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        mpu.math.factorize_many([1, 0])
+
+
+def test_prime_table_threads():
+    # Core Library
+    from concurrent.futures import ThreadPoolExecutor
+
+    table = mpu.math.PrimeTable()
+    limits = [1000 * i for i in range(1, 200)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(table.primes_up_to, limits))
+    for limit, primes in zip(limits, results):
+        assert primes == mpu.math.primes_in_range(0, limit + 1)
+
+
+def test_prime_table_save_load(tmp_path):
+    path = str(tmp_path / "primes.bin")
+    table = mpu.math.PrimeTable()
+    table.extend(10**5)
+    table.save(path)
+
+    loaded = mpu.math.PrimeTable(max_limit=5000)
+    loaded.load(path)
+    assert loaded.limit == 5000
+    assert loaded.primes_up_to(5000) == table.primes_up_to(5000)
+
+    loaded = mpu.math.PrimeTable()
+    loaded.load(path)
+    assert loaded.limit == table.limit
+    assert len(loaded) == len(table) == 9592
+
+
+def test_prime_table_load_invalid(tmp_path):
+    path = tmp_path / "primes.bin"
+    path.write_bytes(b"no primes in here")
+    with pytest.raises(ValueError):
+        mpu.math.PrimeTable().load(str(path))
+
+
+def test_generate_primes_beyond_table(monkeypatch):
+    monkeypatch.setattr(mpu.math, "prime_table", mpu.math.PrimeTable(max_limit=100))
+    primes = list(itertools.islice(mpu.math.generate_primes(), 1000))
+    assert primes == mpu.math.primes_in_range(0, 7920)
+    assert mpu.math.prime_table.limit == 100
+
+
+@given(st.lists(st.integers(-5, 5)), st.integers(0, 10))
+def test_argmax_k(integer_list, k):
+    expected = sorted(range(len(integer_list)), key=lambda i: -integer_list[i])[:k]
+    assert mpu.math.argmax(integer_list, k=k) == expected
+    np = pytest.importorskip("numpy")
+    assert mpu.math.argmax(np.array(integer_list, dtype=int), k=k) == expected
+
+
+@given(st.lists(st.integers(-5, 5)))
+def test_argmax_numpy(integer_list):
+    np = pytest.importorskip("numpy")
+    array = np.array(integer_list, dtype=int)
+    assert mpu.math.argmax(array) == mpu.math.argmax(integer_list)
+
+
+@given(st.lists(st.integers(-(2**20), 2**20), max_size=20))
+def test_product_numpy(integer_list):
+    np = pytest.importorskip("numpy")
+    array = np.array(integer_list, dtype=np.int64)
+    assert mpu.math.product(array, 3) == mpu.math.product(integer_list, 3)
+
+
+def test_round_numpy():
+    np = pytest.importorskip("numpy")
+    numbers = [1.23456, -1.23456, 2.5, 0.3]
+    for decimal_places in [0, 2, 4]:
+        rounded = mpu.math.round_down(np.array(numbers), decimal_places)
+        expected = [mpu.math.round_down(x, decimal_places) for x in numbers]
+        assert rounded.tolist() == expected
+        rounded = mpu.math.round_up(np.array(numbers), decimal_places)
+        expected = [mpu.math.round_up(x, decimal_places) for x in numbers]
+        assert rounded.tolist() == expected
+
+
+@given(st.lists(st.integers()))
+def test_gcd_reduce(integer_list):
+    result = mpu.math.gcd_reduce(integer_list)
+    nonzero = [number for number in integer_list if number != 0]
+    if nonzero:
+        assert result == abs(functools.reduce(mpu.math.gcd, nonzero))
+    else:
+        assert result == 0
+
+
+@given(st.lists(st.integers(-(2**40), 2**40)))
+def test_gcd_reduce_numpy(integer_list):
+    np = pytest.importorskip("numpy")
+    array = np.array(integer_list, dtype=np.int64)
+    assert mpu.math.gcd_reduce(array) == mpu.math.gcd_reduce(integer_list)
+
+
+@given(st.lists(st.tuples(st.integers(-(2**40), 2**40), st.integers(-100, 100))))
+def test_gcd_lcm_many(pairs):
+    np = pytest.importorskip("numpy")
+    a = [x for x, _ in pairs]
+    b = [y for _, y in pairs]
+    gcds = mpu.math.gcd_many(a, b)
+    lcms = mpu.math.lcm_many(a, b)
+    for x, y, gcd, lcm in zip(a, b, gcds, lcms):
+        assert gcd * lcm == abs(x * y)
+    a_array = np.array(a, dtype=np.int64)
+    assert mpu.math.gcd_many(a_array, b).tolist() == gcds
+    assert mpu.math.lcm_many(a_array, b).tolist() == lcms
+
+
+def test_lcm_many_overflow():
+    np = pytest.importorskip("numpy")
+    result = mpu.math.lcm_many(np.array([2**40, 6]), np.array([2**40 - 1, 4]))
+    assert result.tolist() == [2**40 * (2**40 - 1), 12]
+
+
+def test_lcm_reduce():
+    assert mpu.math.lcm_reduce(range(1, 21)) == 232792560
+    assert mpu.math.lcm_reduce([3, 0]) == 0
+
+
+def _gcd_benchmark_data():
+    return [6 * number for number in range(1, 100000)]
+
+
+def test_gcd_reduce_scalar_loop_benchmark(benchmark):
+    numbers = _gcd_benchmark_data()
+    assert benchmark(functools.reduce, mpu.math.gcd, numbers) == 6
+
+
+def test_gcd_reduce_benchmark(benchmark):
+    numbers = _gcd_benchmark_data()
+    assert benchmark(mpu.math.gcd_reduce, numbers) == 6
+
+
+def test_gcd_reduce_numpy_benchmark(benchmark):
+    np = pytest.importorskip("numpy")
+    numbers = np.array(_gcd_benchmark_data())
+    assert benchmark(mpu.math.gcd_reduce, numbers) == 6
+
+
+def test_gcd_many_numpy_benchmark(benchmark):
+    np = pytest.importorskip("numpy")
+    numbers = np.array(_gcd_benchmark_data())
+    result = benchmark(mpu.math.gcd_many, numbers, numbers[::-1])
+    assert (result % 6 == 0).all()
+
+
+@given(st.lists(st.integers(-5, 5)), st.integers(0, 10), st.integers(1, 5))
+def test_top_k(integer_list, k, nb_parts):
+    expected = sorted(enumerate(integer_list), key=lambda pair: -pair[1])[:k]
+    assert mpu.math.top_k(integer_list, k) == expected
+    assert mpu.math.top_k(iter(integer_list), k) == expected
+
+    part_size = len(integer_list) // nb_parts + 1
+    partial_results = [
+        mpu.math.top_k(integer_list[start : start + part_size], k, start=start)
+        for start in range(0, len(integer_list), part_size)
+    ]
+    assert mpu.math.merge_top_k(partial_results, k) == expected
+
+
+def test_top_k_key():
+    words = ["b", "aaa", "cc", "ddd", "e"]
+    assert mpu.math.top_k(words, 2, key=len) == [(1, "aaa"), (3, "ddd")]
+    partial_results = [
+        mpu.math.top_k(words[:2], 2, key=len),
+        mpu.math.top_k(words[2:], 2, key=len, start=2),
+    ]
+    expected = [(1, "aaa"), (3, "ddd"), (2, "cc")]
+    assert mpu.math.merge_top_k(partial_results, 3, key=len) == expected
+
+
+def test_top_k_stream(benchmark):
+    stream = ((i * 7919) % 100003 for i in range(10**5))
+    result = benchmark.pedantic(mpu.math.top_k, args=(stream, 3), rounds=1)
+    assert [value for _, value in result] == [100002, 100001, 100000]